@@ -8,7 +8,7 @@ snooker balls in video streams with automatic table calibration.
 
 from .core import (
     Point, BoundingBox, Detection, TrackedBall, CalibrationData, FrameAnalysis,
-    BallType, DetectionConfig, TrackingConfig, CalibrationConfig, SystemConfig,
+    BallEvent, BallType, DetectionConfig, TrackingConfig, CalibrationConfig, SystemConfig,
     BALL_CLASSES, get_ball_color, get_ball_name
 )
 
@@ -24,7 +24,7 @@ __author__ = "Snooker Analytics Team"
 __all__ = [
     # Core data models
     'Point', 'BoundingBox', 'Detection', 'TrackedBall', 'CalibrationData', 'FrameAnalysis',
-    'BallType', 'DetectionConfig', 'TrackingConfig', 'CalibrationConfig', 'SystemConfig',
+    'BallEvent', 'BallType', 'DetectionConfig', 'TrackingConfig', 'CalibrationConfig', 'SystemConfig',
     'BALL_CLASSES', 'get_ball_color', 'get_ball_name',
     
     # Detection components
@@ -7,11 +7,11 @@ import logging
 import threading
 import time
 from typing import List, Optional, Dict, Any, Callable
-from collections import deque
+from itertools import chain
 import queue
 import numpy as np
 
-from ..core import IDetectionAPI, FrameAnalysis, SystemConfig
+from ..core import IDetectionAPI, FrameAnalysis, SystemConfig, Detection, BallType, BallEvent
 from ..processing import FrameProcessor, VideoInputHandler
 from ..visualization import DebugVisualizer, AnalysisPlotter, RealTimeDisplay
 
@@ -24,11 +24,34 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Ball type names keyed by class id (avoids an Enum lookup per detection)
+_BALL_TYPE_NAMES = {ball_type.value: ball_type.name for ball_type in BallType}
+
+def _format_export_detections(detections: List[Detection]) -> List[Dict[str, Any]]:
+    """Format detections for JSON export with attribute lookups hoisted"""
+    names = _BALL_TYPE_NAMES
+    formatted = []
+    append = formatted.append
+    for d in detections:
+        bbox = d.bbox
+        x1, y1, x2, y2 = bbox.x1, bbox.y1, bbox.x2, bbox.y2
+        append({
+            'ball_type': names[d.class_id],
+            'confidence': d.confidence,
+            'position': {'x': (x1 + x2) / 2, 'y': (y1 + y2) / 2},
+            'bbox': {'x1': x1, 'y1': y1, 'x2': x2, 'y2': y2}
+        })
+    return formatted
+
 class DetectionAPI(IDetectionAPI):
     """Main API for snooker ball detection and analysis"""
     
+    HISTORY_SIZE = 128  # Power of two so ring slots are a bit mask
+    CONFIG_DEBOUNCE_SECONDS = 0.15  # Quiet period before a config change is applied
+    
     def __init__(self, config: SystemConfig):
         self.config = config
+        self._refresh_config_cache()
         self.frame_processor = FrameProcessor(config)
         self.video_handler = VideoInputHandler()
         
@@ -40,12 +63,15 @@ class DetectionAPI(IDetectionAPI):
         
         # Results storage
         self.latest_result = None
-        self.result_history = deque(maxlen=100)  # Keep last 100 results
+        self._history_buf: List[Optional[FrameAnalysis]] = [None] * self.HISTORY_SIZE  # Ring of last results
+        self._history_head = 0  # Total results written; next slot is head & mask
+        self._history_index: Dict[int, FrameAnalysis] = {}  # frame_number -> result in history
         self.result_lock = threading.Lock()
         
         # Callbacks
         self.frame_callbacks: List[Callable[[FrameAnalysis], None]] = []
-        self.event_callbacks: List[Callable[[Dict], None]] = []
+        self.event_callbacks: List[Callable[[BallEvent], None]] = []
+        self._rebuild_dispatch()
         
         # Performance monitoring
         self.performance_stats = {
@@ -63,9 +89,24 @@ class DetectionAPI(IDetectionAPI):
         )
         self.analysis_plotter = AnalysisPlotter()
         self.real_time_display = None
+        self._build_config_appliers()
+        
+        # Latest-only hand-off to the debug visualizer thread: the analysis
+        # worker overwrites the slot, so a slow visualizer drops frames
+        # instead of back-pressuring analysis
+        self.visualizer_thread = None
+        self._vis_cond = threading.Condition()
+        self._vis_slot = None
+        self._vis_running = False
+        self._placeholder_frame = None  # Lazily allocated, read-only
         
-        # Configuration management
+        # Configuration management; change notifications are debounced so an
+        # editor's burst of writes applies the config once
         self.config_manager = None
+        self._config_timer = None
+        self._config_timer_lock = threading.Lock()
+        self._applied_config_version = None  # Manager version last applied to self.config
+        self._field_documentation = None  # Schema is static, so computed once on demand
         if HAS_CONFIG_MANAGEMENT:
             self.config_manager = ConfigManager()
             self.config_manager.add_change_callback(self._on_config_change)
@@ -107,6 +148,10 @@ class DetectionAPI(IDetectionAPI):
             self.performance_stats['frames_analyzed'] = 0
             self.performance_stats['analysis_start_time'] = time.time()
             
+            # Start debug visualizer thread when debug frames are being saved
+            if self.debug_visualizer.save_frames:
+                self._start_visualizer_thread()
+            
             # Start analysis thread
             self.analysis_thread = threading.Thread(
                 target=self._analysis_worker,
@@ -142,6 +187,8 @@ class DetectionAPI(IDetectionAPI):
             if self.analysis_thread.is_alive():
                 logger.warning("Analysis thread did not stop gracefully")
         
+        self._stop_visualizer_thread()
+        
         # Release video source
         self.video_handler.release()
         
@@ -153,13 +200,23 @@ class DetectionAPI(IDetectionAPI):
         fps_counter = 0
         fps_start_time = time.time()
         
+        # Bind per-frame lookups to locals; the source is fixed for this run
+        stop_is_set = self.stop_event.is_set
+        is_opened = self.video_handler.is_opened
+        read_frame = self.video_handler.read_frame
+        process_frame = self.frame_processor.process_frame
+        video_source = self.current_video_source
+        source_type = self.video_handler.source_type
+        is_live_source = source_type in ("camera", "stream")
+        publish_debug_frame = self._publish_debug_frame if self._vis_running else None
+        
         try:
-            while not self.stop_event.is_set() and self.video_handler.is_opened():
+            while not stop_is_set() and is_opened():
                 # Read frame
-                ret, frame = self.video_handler.read_frame()
+                ret, frame = read_frame()
                 
                 if not ret or frame is None:
-                    if self.video_handler.source_type == "file":
+                    if source_type == "file":
                         logger.info("Reached end of video file")
                         break
                     else:
@@ -169,12 +226,12 @@ class DetectionAPI(IDetectionAPI):
                 
                 # Process frame
                 try:
-                    analysis_result = self.frame_processor.process_frame(frame, frame_number, self.current_video_source)
+                    analysis_result = process_frame(frame, frame_number, video_source)
                     
                     # Store result
                     with self.result_lock:
                         self.latest_result = analysis_result
-                        self.result_history.append(analysis_result)
+                        self._append_history(analysis_result)
                     
                     # Update performance stats
                     self.performance_stats['frames_analyzed'] += 1
@@ -189,15 +246,12 @@ class DetectionAPI(IDetectionAPI):
                         fps_counter = 0
                         fps_start_time = current_time
                     
-                    # Call frame callbacks
-                    for callback in self.frame_callbacks:
-                        try:
-                            callback(analysis_result)
-                        except Exception as e:
-                            logger.error(f"Frame callback error: {e}")
+                    # Hand the frame to the debug visualizer thread (never blocks)
+                    if publish_debug_frame is not None:
+                        publish_debug_frame(frame, analysis_result)
                     
-                    # Check for events and call event callbacks
-                    self._check_and_notify_events(analysis_result)
+                    # Call frame callbacks, then check for events and call event callbacks
+                    self._dispatch(analysis_result)
                     
                 except Exception as e:
                     logger.error(f"Frame processing error: {e}")
@@ -205,7 +259,7 @@ class DetectionAPI(IDetectionAPI):
                 frame_number += 1
                 
                 # Rate limiting for live sources
-                if self.video_handler.source_type in ["camera", "stream"]:
+                if is_live_source:
                     target_fps = self.performance_stats['fps_target']
                     if target_fps > 0:
                         time.sleep(max(0, 1.0/target_fps - 0.001))
@@ -214,8 +268,81 @@ class DetectionAPI(IDetectionAPI):
             logger.error(f"Analysis worker error: {e}")
         finally:
             self.is_running = False
+            self._signal_visualizer_stop()
             logger.info("Analysis worker finished")
     
+    def _start_visualizer_thread(self) -> None:
+        """Start the debug visualizer thread"""
+        with self._vis_cond:
+            self._vis_slot = None
+            self._vis_running = True
+        
+        self.visualizer_thread = threading.Thread(
+            target=self._visualizer_worker,
+            name="SnookerDebugVisualizer",
+            daemon=True
+        )
+        self.visualizer_thread.start()
+    
+    def _signal_visualizer_stop(self) -> None:
+        """Ask the visualizer thread to exit once the pending frame is rendered"""
+        with self._vis_cond:
+            self._vis_running = False
+            self._vis_cond.notify()
+    
+    def _stop_visualizer_thread(self) -> None:
+        """Stop the debug visualizer thread and wait for it to finish"""
+        self._signal_visualizer_stop()
+        
+        if self.visualizer_thread and self.visualizer_thread.is_alive():
+            self.visualizer_thread.join(timeout=5.0)
+            if self.visualizer_thread.is_alive():
+                logger.warning("Visualizer thread did not stop gracefully")
+        self.visualizer_thread = None
+    
+    def _publish_debug_frame(self, frame: np.ndarray, analysis: FrameAnalysis) -> None:
+        """Overwrite the single visualizer slot with the latest frame"""
+        with self._vis_cond:
+            self._vis_slot = (frame, analysis)
+            self._vis_cond.notify()
+    
+    def _visualizer_worker(self) -> None:
+        """Render the most recent frame whenever one is published"""
+        while True:
+            with self._vis_cond:
+                while self._vis_slot is None and self._vis_running:
+                    self._vis_cond.wait()
+                item, self._vis_slot = self._vis_slot, None
+            
+            if item is None:
+                break
+            
+            frame, analysis = item
+            try:
+                self.debug_visualizer.visualize_frame_analysis(frame, analysis)
+            except Exception as e:
+                logger.error(f"Debug visualization error: {e}")
+        
+        logger.info("Visualizer worker finished")
+    
+    def _rebuild_dispatch(self) -> None:
+        """Fuse frame and event callback invocation into a single per-frame closure"""
+        frame_callbacks = tuple(self.frame_callbacks)
+        notify_events = self._check_and_notify_events if self.event_callbacks else None
+        
+        def dispatch(analysis: FrameAnalysis) -> None:
+            for callback in frame_callbacks:
+                try:
+                    callback(analysis)
+                except Exception as e:
+                    logger.error(f"Frame callback error: {e}")
+            
+            # Event detection is skipped entirely while nobody is listening
+            if notify_events is not None:
+                notify_events(analysis)
+        
+        self._dispatch = dispatch
+    
     def _check_and_notify_events(self, analysis: FrameAnalysis) -> None:
         """Check for events and notify callbacks"""
         # This is a simplified event detection - in practice, you'd use the trajectory analyzer
@@ -223,15 +350,14 @@ class DetectionAPI(IDetectionAPI):
         
         # Example: Ball potting detection
         for ball in analysis.tracked_balls:
-            if hasattr(ball, 'was_potted') and ball.was_potted:
-                event = {
-                    'type': 'ball_potted',
-                    'ball_id': ball.track_id,
-                    'ball_type': ball.ball_type.name,
-                    'frame': analysis.frame_number,
-                    'timestamp': analysis.timestamp
-                }
-                events.append(event)
+            if getattr(ball, 'was_potted', False):
+                events.append(BallEvent(
+                    BallEvent.BALL_POTTED,
+                    ball.track_id,
+                    ball.ball_type,
+                    analysis.frame_number,
+                    analysis.timestamp
+                ))
         
         # Notify event callbacks
         for event in events:
@@ -248,11 +374,37 @@ class DetectionAPI(IDetectionAPI):
     
     def get_analysis_history(self, num_frames: int = 10) -> List[FrameAnalysis]:
         """Get recent analysis history"""
+        history = self._snapshot_history()
+        if num_frames <= 0:
+            return list(history)
+        else:
+            return list(history[-num_frames:])
+    
+    def _append_history(self, analysis: FrameAnalysis) -> None:
+        """Write to the history ring keeping the frame-number index in sync (caller holds result_lock)"""
+        head = self._history_head
+        slot = head & (self.HISTORY_SIZE - 1)
+        evicted = self._history_buf[slot]
+        # Only drop the index entry if a newer result has not replaced it
+        if evicted is not None and self._history_index.get(evicted.frame_number) is evicted:
+            del self._history_index[evicted.frame_number]
+        self._history_buf[slot] = analysis
+        self._history_head = head + 1
+        self._history_index[analysis.frame_number] = analysis
+    
+    def _snapshot_history(self) -> tuple:
+        """Copy-on-read snapshot of the result history, oldest first.
+        
+        Only the C-level list slicing runs under ``result_lock``; callers format
+        the snapshot afterwards without holding up the analysis worker.
+        """
         with self.result_lock:
-            if num_frames <= 0:
-                return list(self.result_history)
-            else:
-                return list(self.result_history)[-num_frames:]
+            head = self._history_head
+            buf = self._history_buf
+            if head <= self.HISTORY_SIZE:
+                return tuple(buf[:head])
+            slot = head & (self.HISTORY_SIZE - 1)
+            return tuple(buf[slot:] + buf[:slot])
     
     def is_analyzing(self) -> bool:
         """Check if analysis is running"""
@@ -261,23 +413,27 @@ class DetectionAPI(IDetectionAPI):
     def add_frame_callback(self, callback: Callable[[FrameAnalysis], None]) -> None:
         """Add callback for frame analysis results"""
         self.frame_callbacks.append(callback)
+        self._rebuild_dispatch()
         logger.debug("Frame callback added")
     
-    def add_event_callback(self, callback: Callable[[Dict], None]) -> None:
-        """Add callback for detected events"""
+    def add_event_callback(self, callback: Callable[[BallEvent], None]) -> None:
+        """Add callback for detected events (use ``BallEvent.to_dict()`` for JSON)"""
         self.event_callbacks.append(callback)
+        self._rebuild_dispatch()
         logger.debug("Event callback added")
     
     def remove_frame_callback(self, callback: Callable[[FrameAnalysis], None]) -> None:
         """Remove frame callback"""
         if callback in self.frame_callbacks:
             self.frame_callbacks.remove(callback)
+            self._rebuild_dispatch()
             logger.debug("Frame callback removed")
     
-    def remove_event_callback(self, callback: Callable[[Dict], None]) -> None:
+    def remove_event_callback(self, callback: Callable[[BallEvent], None]) -> None:
         """Remove event callback"""
         if callback in self.event_callbacks:
             self.event_callbacks.remove(callback)
+            self._rebuild_dispatch()
             logger.debug("Event callback removed")
     
     def get_system_status(self) -> Dict[str, Any]:
@@ -338,6 +494,7 @@ class DetectionAPI(IDetectionAPI):
             if 'confidence_threshold' in config_updates:
                 threshold = config_updates['confidence_threshold']
                 self.frame_processor.update_detection_threshold(threshold)
+                self._refresh_config_cache()
             
             # Update FPS target
             if 'target_fps' in config_updates:
@@ -379,8 +536,8 @@ class DetectionAPI(IDetectionAPI):
         try:
             import json
             
-            # Collect analysis data
-            history = self.get_analysis_history(0)  # Get all history
+            # Collect analysis data (snapshot, formatted outside the lock)
+            history = self._snapshot_history()
             
             export_data = {
                 'metadata': {
@@ -388,10 +545,10 @@ class DetectionAPI(IDetectionAPI):
                     'total_frames': len(history),
                     'video_source': self.video_handler.get_video_properties(),
                     'system_config': {
-                        'detection_threshold': self.config.detection.confidence_threshold,
+                        'detection_threshold': self._conf_threshold,
                         'tracking_config': {
-                            'max_distance': self.config.tracking.max_tracking_distance,
-                            'max_disappeared': self.config.tracking.max_disappeared_frames
+                            'max_distance': self._max_track_dist,
+                            'max_disappeared': self._max_disappeared
                         }
                     }
                 },
@@ -404,15 +561,7 @@ class DetectionAPI(IDetectionAPI):
                     'frame_number': analysis.frame_number,
                     'timestamp': analysis.timestamp,
                     'processing_time': analysis.processing_time,
-                    'detections': [
-                        {
-                            'ball_type': d.get_ball_type().name,
-                            'confidence': d.confidence,
-                            'position': {'x': d.get_centroid().x, 'y': d.get_centroid().y},
-                            'bbox': {'x1': d.bbox.x1, 'y1': d.bbox.y1, 'x2': d.bbox.x2, 'y2': d.bbox.y2}
-                        }
-                        for d in analysis.detections
-                    ],
+                    'detections': _format_export_detections(analysis.detections),
                     'tracked_balls': [
                         {
                             'track_id': ball.track_id,
@@ -486,11 +635,8 @@ class DetectionAPI(IDetectionAPI):
             # Get frame and analysis
             if frame_number is not None:
                 # Find specific frame in history
-                analysis = None
-                for hist_analysis in self.result_history:
-                    if hist_analysis.frame_number == frame_number:
-                        analysis = hist_analysis
-                        break
+                with self.result_lock:
+                    analysis = self._history_index.get(frame_number)
                 
                 if analysis is None:
                     logger.warning(f"Frame {frame_number} not found in history")
@@ -503,12 +649,20 @@ class DetectionAPI(IDetectionAPI):
                     return None
             
             # Get corresponding video frame (this would need to be stored or retrieved)
-            # For now, create a placeholder frame
-            frame = np.zeros((720, 1280, 3), dtype=np.uint8)
+            # For now, reuse a shared read-only placeholder frame; the visualizer
+            # copies before drawing, so it is never mutated
+            if self._placeholder_frame is None:
+                self._placeholder_frame = np.zeros((720, 1280, 3), dtype=np.uint8)
+                self._placeholder_frame.setflags(write=False)
+            frame = self._placeholder_frame
             
             # Create visualization
             vis_frame = self.debug_visualizer.visualize_frame_analysis(frame, analysis)
             
+            # Overlay disabled returns the input unchanged; never hand out the shared buffer
+            if vis_frame is frame:
+                vis_frame = frame.copy()
+            
             return vis_frame
             
         except Exception as e:
@@ -522,7 +676,7 @@ class DetectionAPI(IDetectionAPI):
             os.makedirs(output_directory, exist_ok=True)
             
             # Get analysis history
-            history = self.get_analysis_history(len(self.result_history))
+            history = self.get_analysis_history(0)
             
             if not history:
                 logger.warning("No analysis history available for plotting")
@@ -535,9 +689,9 @@ class DetectionAPI(IDetectionAPI):
             )
             
             # Generate trajectory analysis plot
-            all_tracked_balls = []
-            for analysis in history:
-                all_tracked_balls.extend(analysis.tracked_balls)
+            all_tracked_balls = list(chain.from_iterable(
+                analysis.tracked_balls for analysis in history
+            ))
             
             if all_tracked_balls:
                 trajectory_plot = self.analysis_plotter.plot_trajectory_analysis(
@@ -580,8 +734,8 @@ class DetectionAPI(IDetectionAPI):
                 frame_id = frame_number if frame_number is not None else "latest"
                 output_path = f"debug_frame_{frame_id}_{timestamp}.jpg"
             
-            import cv2
-            cv2.imwrite(output_path, vis_frame)
+            if not self.debug_visualizer.write_image(output_path, vis_frame):
+                return False
             
             logger.info(f"Debug frame saved: {output_path}")
             return True
@@ -631,8 +785,7 @@ class DetectionAPI(IDetectionAPI):
             
             if validation_result.is_valid:
                 # Update system configuration
-                new_system_config = self.config_manager.get_system_config()
-                self._update_system_config(new_system_config)
+                self._apply_manager_config()
                 
                 logger.info(f"Configuration loaded: {validation_result.get_summary()}")
                 return True
@@ -673,8 +826,7 @@ class DetectionAPI(IDetectionAPI):
         
         if success:
             # Apply configuration changes
-            new_system_config = self.config_manager.get_system_config()
-            self._update_system_config(new_system_config)
+            self._apply_manager_config()
         
         return success
     
@@ -688,8 +840,7 @@ class DetectionAPI(IDetectionAPI):
         
         if validation_result.is_valid:
             # Apply configuration changes
-            new_system_config = self.config_manager.get_system_config()
-            self._update_system_config(new_system_config)
+            self._apply_manager_config()
             return True
         else:
             logger.error(f"Configuration update failed: {validation_result.get_summary()}")
@@ -719,8 +870,7 @@ class DetectionAPI(IDetectionAPI):
             self.config_manager.reset_to_defaults()
             
             # Apply default configuration
-            new_system_config = self.config_manager.get_system_config()
-            self._update_system_config(new_system_config)
+            self._apply_manager_config()
             
             logger.info("Configuration reset to defaults")
             return True
@@ -785,49 +935,97 @@ class DetectionAPI(IDetectionAPI):
         if not self.config_manager:
             return {"available": False}
         
+        if self._field_documentation is None:
+            self._field_documentation = self.config_manager.get_field_documentation()
+        
         return {
             "available": True,
             "config_file": str(self.config_manager.config_file) if self.config_manager.config_file else None,
             "auto_reload_enabled": self.config_manager._auto_reload,
-            "field_documentation": self.config_manager.get_field_documentation()
+            "field_documentation": self._field_documentation
         }
     
     def _on_config_change(self, new_config: dict) -> None:
-        """Handle configuration changes"""
+        """Handle configuration changes, applying only the last of a burst"""
+        with self._config_timer_lock:
+            if self._config_timer is not None:
+                self._config_timer.cancel()
+            
+            self._config_timer = threading.Timer(self.CONFIG_DEBOUNCE_SECONDS, self._apply_pending_config)
+            self._config_timer.daemon = True
+            self._config_timer.start()
+    
+    def _apply_pending_config(self) -> None:
+        """Apply the configuration once a burst of changes has settled"""
+        with self._config_timer_lock:
+            if self._config_timer is threading.current_thread():
+                self._config_timer = None
+        
         try:
-            # Convert to SystemConfig and update
-            new_system_config = self.config_manager.get_system_config()
-            self._update_system_config(new_system_config)
+            # Changes made through this API were applied synchronously already
+            if self.config_manager.version == self._applied_config_version:
+                return
+            self._apply_manager_config()
             
             logger.info("Configuration updated automatically")
             
         except Exception as e:
             logger.error(f"Failed to apply configuration changes: {e}")
     
-    def _update_system_config(self, new_config: SystemConfig) -> None:
-        """Update system configuration"""
-        # Update main config
-        self.config = new_config
+    def _apply_manager_config(self) -> None:
+        """Apply the managed configuration and remember which version was applied"""
+        # Read the version first: a change racing in between is applied again, never skipped
+        version = self.config_manager.version
+        self._update_system_config(self.config_manager.get_system_config())
+        self._applied_config_version = version
+    
+    def _refresh_config_cache(self) -> None:
+        """Bind frequently read config values to flat attributes"""
+        self._conf_threshold = self.config.detection.confidence_threshold
+        self._max_track_dist = self.config.tracking.max_tracking_distance
+        self._max_disappeared = self.config.tracking.max_disappeared_frames
+    
+    def _build_config_appliers(self) -> None:
+        """Resolve the components a config update touches once, as a list of appliers"""
+        appliers = []
+        frame_processor = self.frame_processor
         
-        # Update frame processor config
-        if hasattr(self.frame_processor, 'config'):
-            self.frame_processor.config = new_config
+        # Frame processor config
+        if hasattr(frame_processor, 'config'):
+            def apply_frame_processor(cfg: SystemConfig) -> None:
+                frame_processor.config = cfg
+            appliers.append(apply_frame_processor)
         
-        # Update detection engine config
-        if hasattr(self.frame_processor, 'detection_engine'):
-            detection_engine = self.frame_processor.detection_engine
+        # Detection engine config and confidence threshold
+        detection_engine = getattr(frame_processor, 'detection_engine', None)
+        if detection_engine is not None:
             if hasattr(detection_engine, 'config'):
-                detection_engine.config = new_config.detection
+                def apply_detection_config(cfg: SystemConfig) -> None:
+                    detection_engine.config = cfg.detection
+                appliers.append(apply_detection_config)
             
-            # Update confidence threshold
             if hasattr(detection_engine, 'set_confidence_threshold'):
-                detection_engine.set_confidence_threshold(new_config.detection.confidence_threshold)
+                set_threshold = detection_engine.set_confidence_threshold
+                def apply_confidence_threshold(cfg: SystemConfig) -> None:
+                    set_threshold(cfg.detection.confidence_threshold)
+                appliers.append(apply_confidence_threshold)
         
-        # Update visualization settings
+        # Visualization settings
         if self.debug_visualizer:
-            self.debug_visualizer.set_visualization_options(
-                enable_overlay=new_config.debug_mode,
-                save_frames=new_config.save_debug_frames
-            )
+            set_options = self.debug_visualizer.set_visualization_options
+            def apply_visualization(cfg: SystemConfig) -> None:
+                set_options(enable_overlay=cfg.debug_mode, save_frames=cfg.save_debug_frames)
+            appliers.append(apply_visualization)
+        
+        self._config_appliers = tuple(appliers)
+    
+    def _update_system_config(self, new_config: SystemConfig) -> None:
+        """Update system configuration"""
+        # Update main config
+        self.config = new_config
+        self._refresh_config_cache()
+        
+        for apply in self._config_appliers:
+            apply(new_config)
         
         logger.debug("System configuration updated")
\ No newline at end of file
@@ -5,12 +5,15 @@ Calibration module for snooker table geometry detection
 
 from .table_calibration_engine import TableCalibrationEngine
 from .coordinate_transformer import CoordinateTransformer, TableGeometry
-from .calibration_persistence import CalibrationPersistenceManager, CalibrationRecoveryManager
+from .calibration_persistence import (
+    CalibrationPersistenceManager, CalibrationRecoveryManager, LazyCalibrationData
+)
 
 __all__ = [
     'TableCalibrationEngine', 
     'CoordinateTransformer', 
     'TableGeometry',
     'CalibrationPersistenceManager',
-    'CalibrationRecoveryManager'
+    'CalibrationRecoveryManager',
+    'LazyCalibrationData'
 ]
\ No newline at end of file
@@ -5,17 +5,151 @@ Calibration Persistence Manager for saving and loading calibration data
 
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import os
 import pickle
+import shutil
+import struct
 import time
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Union
 import numpy as np
 
+# Optional orjson import for faster metadata parsing
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 from ..core import CalibrationData, Point, BoundingBox
 
 logger = logging.getLogger(__name__)
 
+if HAS_ORJSON:
+    def _json_dumps(obj: Any) -> bytes:
+        """Serialize metadata to indented JSON bytes"""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    
+    _json_loads = orjson.loads
+else:
+    def _json_dumps(obj: Any) -> bytes:
+        """Serialize metadata to indented JSON bytes"""
+        return json.dumps(obj, indent=2).encode()
+    
+    _json_loads = json.loads
+
+# Header marking calibration files pickled with protocol 5 and out-of-band buffers
+_OOB_PICKLE_MAGIC = b"SNKCAL5\x00"
+
+@lru_cache(maxsize=4)
+def _parse_metadata(path: str, mtime_ns: int, size: int, inode: int) -> Dict[str, Any]:
+    """Read and parse a metadata file; the stat fields only key the cache"""
+    with open(path, 'rb') as f:
+        return _json_loads(f.read())
+
+def _dump_pickle(obj: Any, f) -> None:
+    """Pickle with protocol 5, writing ndarray buffers out-of-band after the stream"""
+    buffers = []
+    payload = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+    
+    f.write(_OOB_PICKLE_MAGIC)
+    f.write(struct.pack("<QI", len(payload), len(buffers)))
+    f.write(payload)
+    for buffer in buffers:
+        raw = buffer.raw()
+        f.write(struct.pack("<Q", raw.nbytes))
+        f.write(raw)
+
+def _load_pickle(f) -> Any:
+    """Load a file written by _dump_pickle (or an older plain pickle)"""
+    magic = f.read(len(_OOB_PICKLE_MAGIC))
+    if magic != _OOB_PICKLE_MAGIC:
+        f.seek(0)
+        return pickle.load(f)
+    
+    payload_size, buffer_count = struct.unpack("<QI", f.read(12))
+    payload = f.read(payload_size)
+    
+    buffers = []
+    for _ in range(buffer_count):
+        (size,) = struct.unpack("<Q", f.read(8))
+        # Read straight into a writable buffer that the ndarray then wraps
+        buffer = bytearray(size)
+        if f.readinto(buffer) != size:
+            raise EOFError("Truncated calibration buffer")
+        buffers.append(buffer)
+    
+    return pickle.loads(payload, buffers=buffers)
+
+class _LazyField:
+    """Non-data descriptor that materializes a LazyCalibrationData field on first read"""
+    
+    def __set_name__(self, owner, name):
+        self.name = name
+    
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        # Once materialized the value sits in the instance dict and shadows this descriptor
+        obj._materialize()
+        return obj.__dict__[self.name]
+
+class LazyCalibrationData(CalibrationData):
+    """CalibrationData that reads the cached payload only when it is first needed
+    
+    Fields recorded in the metadata sidecar are available immediately and
+    ``is_calibrated()`` is answered from them, so validity checks never decode
+    the pickle or read the homography.
+    """
+    
+    homography_matrix = _LazyField()
+    table_corners = _LazyField()
+    pocket_regions = _LazyField()
+    
+    def __init__(self, persistence_manager: 'CalibrationPersistenceManager', metadata: Dict[str, Any],
+                 payload_identity: Optional[tuple] = None):
+        # CalibrationData.__init__ is skipped on purpose; payload fields load on demand
+        self._persistence_manager = persistence_manager
+        self._metadata = metadata
+        # (st_ino, st_mtime_ns, st_size) of the payload file the metadata belongs to
+        self._payload_identity = payload_identity
+        self._materialized = False
+        self.table_dimensions = tuple(metadata["table_dimensions"])
+        self.calibration_timestamp = metadata["calibration_timestamp"]
+        self.is_valid = metadata["is_valid"]
+    
+    def is_calibrated(self) -> bool:
+        """Check if calibration is valid, from metadata while not yet materialized"""
+        if self._materialized or "has_homography" not in self._metadata:
+            return super().is_calibrated()
+        return (self.is_valid and
+                self._metadata["has_homography"] and
+                self._metadata["corners_count"] == 4)
+    
+    def _materialize(self) -> None:
+        """Load the payload fields from the cache (once)"""
+        if self._materialized:
+            return
+        self._materialized = True
+        
+        try:
+            loaded = self._persistence_manager._load_payload(self._payload_identity)
+            payload = {
+                "homography_matrix": loaded.homography_matrix,
+                "table_corners": loaded.table_corners,
+                "pocket_regions": loaded.pocket_regions
+            }
+        except Exception as e:
+            logger.error(f"Failed to materialize cached calibration data: {e}")
+            payload = {"homography_matrix": None, "table_corners": [], "pocket_regions": []}
+            self.is_valid = False
+        
+        # Keep any value assigned before materialization
+        for name, value in payload.items():
+            self.__dict__.setdefault(name, value)
+
 class CalibrationPersistenceManager:
     """Manages saving and loading of calibration data"""
     
@@ -26,6 +160,10 @@ class CalibrationPersistenceManager:
         # File paths
         self.calibration_file = self.cache_directory / "calibration_data.pkl"
         self.metadata_file = self.cache_directory / "calibration_metadata.json"
+        # Zero-byte flag present only while the cached calibration is valid
+        self.valid_sentinel_file = self.cache_directory / "calibration.valid"
+        # Homography file written by older versions; now stored inside calibration_file
+        self.homography_file = self.cache_directory / "calibration_homography.npy"
         self.backup_directory = self.cache_directory / "backups"
         self.backup_directory.mkdir(exist_ok=True)
         
@@ -33,6 +171,9 @@ class CalibrationPersistenceManager:
         self.max_cache_age_hours = 24  # Maximum age before cache is considered stale
         self.max_backups = 5  # Maximum number of backup files to keep
         
+        # Single worker keeps backup housekeeping ordered and off the caller's thread
+        self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="calibration-io")
+        
         logger.info(f"Calibration persistence initialized: {self.cache_directory}")
     
     def save_calibration_data(self, calibration_data: CalibrationData, 
@@ -46,9 +187,10 @@ class CalibrationPersistenceManager:
             # Prepare data for serialization
             serializable_data = self._prepare_for_serialization(calibration_data)
             
-            # Save binary data (numpy arrays)
-            with open(self.calibration_file, 'wb') as f:
-                pickle.dump(serializable_data, f)
+            # Write binary data next to the live file; renamed into place below
+            tmp_calibration_file = self.calibration_file.with_suffix('.pkl.tmp')
+            with open(tmp_calibration_file, 'wb') as f:
+                _dump_pickle(serializable_data, f)
             
             # Save metadata
             metadata = {
@@ -59,11 +201,29 @@ class CalibrationPersistenceManager:
                 "corners_count": len(calibration_data.table_corners),
                 "pockets_count": len(calibration_data.pocket_regions),
                 "is_valid": calibration_data.is_valid,
+                "has_homography": calibration_data.homography_matrix is not None,
                 "calibration_timestamp": calibration_data.calibration_timestamp
             }
             
-            with open(self.metadata_file, 'w') as f:
-                json.dump(metadata, f, indent=2)
+            tmp_metadata_file = self.metadata_file.with_suffix('.json.tmp')
+            with open(tmp_metadata_file, 'wb') as f:
+                f.write(_json_dumps(metadata))
+            
+            # The sentinel is dropped before and created after the metadata lands,
+            # so it never claims validity the metadata does not back
+            if not calibration_data.is_valid:
+                self._remove_file(self.valid_sentinel_file)
+            
+            # Metadata lands last so a crash never pairs new metadata with an old payload
+            os.replace(tmp_calibration_file, self.calibration_file)
+            os.replace(tmp_metadata_file, self.metadata_file)
+            
+            if calibration_data.is_valid:
+                self.valid_sentinel_file.touch()
+            
+            # Drop the separate homography file left by older versions
+            if self.homography_file.exists():
+                self.homography_file.unlink()
             
             logger.info(f"Calibration data saved successfully for {video_source}")
             return True
@@ -72,17 +232,23 @@ class CalibrationPersistenceManager:
             logger.error(f"Failed to save calibration data: {e}")
             return False
     
-    def load_calibration_data(self, max_age_hours: Optional[float] = None) -> Optional[CalibrationData]:
-        """Load calibration data from cache"""
+    def load_calibration_data(self, max_age_hours: Optional[float] = None,
+                              lazy: bool = True) -> Optional[CalibrationData]:
+        """Load calibration data from cache
+        
+        With ``lazy`` (the default) a LazyCalibrationData is returned and the
+        binary payload is only read when a payload field is first accessed.
+        """
         try:
-            if not self.calibration_file.exists() or not self.metadata_file.exists():
+            # The payload is renamed into place before its metadata, so statting
+            # it first never pairs older metadata with a newer payload
+            try:
+                payload_identity = self._file_identity(os.stat(self.calibration_file))
+                metadata = self._read_metadata()
+            except FileNotFoundError:
                 logger.debug("No cached calibration data found")
                 return None
             
-            # Check metadata first
-            with open(self.metadata_file, 'r') as f:
-                metadata = json.load(f)
-            
             # Check if cache is too old
             cache_age_hours = (time.time() - metadata["timestamp"]) / 3600
             max_age = max_age_hours if max_age_hours is not None else self.max_cache_age_hours
@@ -91,12 +257,10 @@ class CalibrationPersistenceManager:
                 logger.info(f"Cached calibration data is too old ({cache_age_hours:.1f}h > {max_age}h)")
                 return None
             
-            # Load binary data
-            with open(self.calibration_file, 'rb') as f:
-                serializable_data = pickle.load(f)
-            
-            # Reconstruct CalibrationData object
-            calibration_data = self._reconstruct_from_serialization(serializable_data)
+            if lazy:
+                calibration_data = LazyCalibrationData(self, metadata, payload_identity)
+            else:
+                calibration_data = self._load_payload()
             
             logger.info(f"Loaded cached calibration data (age: {cache_age_hours:.1f}h)")
             return calibration_data
@@ -105,19 +269,60 @@ class CalibrationPersistenceManager:
             logger.error(f"Failed to load calibration data: {e}")
             return None
     
+    @staticmethod
+    def _file_identity(stat_result: os.stat_result) -> tuple:
+        """Identify one version of a file; saves rename a new inode into place"""
+        return (stat_result.st_ino, stat_result.st_mtime_ns, stat_result.st_size)
+    
+    def _load_payload(self, expected_identity: Optional[tuple] = None) -> CalibrationData:
+        """Read the pickled payload and homography into a CalibrationData
+        
+        With ``expected_identity`` the read fails if the payload file has been
+        replaced since that identity was taken.
+        """
+        with open(self.calibration_file, 'rb') as f:
+            if (expected_identity is not None and
+                    self._file_identity(os.fstat(f.fileno())) != expected_identity):
+                raise ValueError("Cached calibration was replaced after it was loaded")
+            serializable_data = _load_pickle(f)
+        
+        return self._reconstruct_from_serialization(serializable_data, self.homography_file)
+    
+    def _read_metadata(self, metadata_stat: Optional[os.stat_result] = None) -> Dict[str, Any]:
+        """Return the parsed metadata, reusing the last parse while the file is unchanged"""
+        if metadata_stat is None:
+            metadata_stat = os.stat(self.metadata_file)
+        
+        # Rewrites rename a new file into place, so the inode changes even when
+        # the mtime resolution is coarse
+        metadata = _parse_metadata(str(self.metadata_file), metadata_stat.st_mtime_ns,
+                                   metadata_stat.st_size, metadata_stat.st_ino)
+        return dict(metadata)
+    
     def is_cache_valid(self, max_age_hours: Optional[float] = None) -> bool:
         """Check if cached calibration data is valid and not too old"""
         try:
-            if not self.metadata_file.exists():
+            try:
+                metadata_stat = os.stat(self.metadata_file)
+            except FileNotFoundError:
                 return False
             
-            with open(self.metadata_file, 'r') as f:
-                metadata = json.load(f)
-            
-            # Check age
-            cache_age_hours = (time.time() - metadata["timestamp"]) / 3600
+            # The file is written after the timestamp is taken, so a stale mtime
+            # means a stale cache without reading the file
+            now = time.time()
             max_age = max_age_hours if max_age_hours is not None else self.max_cache_age_hours
+            if (now - metadata_stat.st_mtime) / 3600 > max_age:
+                return False
             
+            # Fresh and flagged valid: answered without reading any file
+            if self.valid_sentinel_file.exists():
+                return True
+            
+            # Invalid, or written before the sentinel existed
+            metadata = self._read_metadata(metadata_stat)
+            
+            # Check age
+            cache_age_hours = (now - metadata["timestamp"]) / 3600
             if cache_age_hours > max_age:
                 return False
             
@@ -131,12 +336,11 @@ class CalibrationPersistenceManager:
     def get_cache_metadata(self) -> Optional[Dict[str, Any]]:
         """Get metadata about cached calibration data"""
         try:
-            if not self.metadata_file.exists():
+            try:
+                metadata = self._read_metadata()
+            except FileNotFoundError:
                 return None
             
-            with open(self.metadata_file, 'r') as f:
-                metadata = json.load(f)
-            
             # Add computed fields
             cache_age_hours = (time.time() - metadata["timestamp"]) / 3600
             metadata["cache_age_hours"] = cache_age_hours
@@ -151,26 +355,19 @@ class CalibrationPersistenceManager:
     def clear_cache(self) -> bool:
         """Clear all cached calibration data"""
         try:
-            files_removed = 0
-            
-            if self.calibration_file.exists():
-                self.calibration_file.unlink()
-                files_removed += 1
-            
-            if self.metadata_file.exists():
-                self.metadata_file.unlink()
-                files_removed += 1
+            # Only remove files this manager writes; the directory may be shared
+            for path in (self.calibration_file, self.metadata_file,
+                         self.valid_sentinel_file, self.homography_file):
+                self._remove_file(path)
             
-            # Clear backups
-            for backup_file in self.backup_directory.glob("*.pkl"):
-                backup_file.unlink()
-                files_removed += 1
+            # Temporary files left by interrupted saves
+            for tmp_file in self.cache_directory.glob("*.tmp"):
+                self._remove_file(tmp_file)
             
-            for backup_file in self.backup_directory.glob("*.json"):
-                backup_file.unlink()
-                files_removed += 1
+            for backup_file in self.backup_directory.glob("calibration_*"):
+                self._remove_file(backup_file)
             
-            logger.info(f"Cleared calibration cache ({files_removed} files removed)")
+            logger.info(f"Cleared calibration cache: {self.cache_directory}")
             return True
             
         except Exception as e:
@@ -179,22 +376,35 @@ class CalibrationPersistenceManager:
     
     def _prepare_for_serialization(self, calibration_data: CalibrationData) -> Dict[str, Any]:
         """Prepare CalibrationData for serialization"""
+        # Arrays go out-of-band and are read straight into their own buffers; corners and
+        # pockets use an inferred dtype so values stay exact
+        homography = calibration_data.homography_matrix
         return {
-            "homography_matrix": calibration_data.homography_matrix,
-            "table_corners": [(p.x, p.y) for p in calibration_data.table_corners],
+            "homography_matrix": None if homography is None else np.ascontiguousarray(homography),
+            "table_corners": np.asarray(
+                [(p.x, p.y) for p in calibration_data.table_corners]
+            ).reshape(-1, 2),
             "table_dimensions": calibration_data.table_dimensions,
-            "pocket_regions": [(bb.x1, bb.y1, bb.x2, bb.y2) for bb in calibration_data.pocket_regions],
+            "pocket_regions": np.asarray(
+                [(bb.x1, bb.y1, bb.x2, bb.y2) for bb in calibration_data.pocket_regions]
+            ).reshape(-1, 4),
             "calibration_timestamp": calibration_data.calibration_timestamp,
             "is_valid": calibration_data.is_valid
         }
     
-    def _reconstruct_from_serialization(self, data: Dict[str, Any]) -> CalibrationData:
+    def _reconstruct_from_serialization(self, data: Dict[str, Any],
+                                        homography_file: Optional[Path] = None) -> CalibrationData:
         """Reconstruct CalibrationData from serialized data"""
+        homography = data.get("homography_matrix")
+        if homography is None and homography_file is not None and homography_file.exists():
+            # Older versions kept the homography in a separate .npy
+            homography = np.load(homography_file)
+        
         return CalibrationData(
-            homography_matrix=data["homography_matrix"],
-            table_corners=[Point(x, y) for x, y in data["table_corners"]],
+            homography_matrix=homography,
+            table_corners=Point.from_array(data["table_corners"]),
             table_dimensions=data["table_dimensions"],
-            pocket_regions=[BoundingBox(x1, y1, x2, y2) for x1, y1, x2, y2 in data["pocket_regions"]],
+            pocket_regions=BoundingBox.from_array(data["pocket_regions"]),
             calibration_timestamp=data["calibration_timestamp"],
             is_valid=data["is_valid"]
         )
@@ -205,92 +415,187 @@ class CalibrationPersistenceManager:
             timestamp = int(time.time())
             backup_cal_file = self.backup_directory / f"calibration_data_{timestamp}.pkl"
             backup_meta_file = self.backup_directory / f"calibration_metadata_{timestamp}.json"
+            backup_homography_file = self.backup_directory / f"calibration_homography_{timestamp}.npy"
             
-            # Copy files
+            # Hardlink files; saves rename new files into place so the old inodes stay intact
             if self.calibration_file.exists():
-                import shutil
-                shutil.copy2(self.calibration_file, backup_cal_file)
+                self._link_or_copy(self.calibration_file, backup_cal_file)
             
             if self.metadata_file.exists():
-                import shutil
-                shutil.copy2(self.metadata_file, backup_meta_file)
+                self._link_or_copy(self.metadata_file, backup_meta_file)
+            
+            if self.homography_file.exists():
+                self._link_or_copy(self.homography_file, backup_homography_file)
             
-            # Clean up old backups
-            self._cleanup_old_backups()
+            # Clean up old backups in the background; the links above must stay
+            # synchronous so they capture the files before the new ones land
+            self._io_pool.submit(self._cleanup_old_backups)
             
             logger.debug(f"Created calibration backup: {timestamp}")
             
         except Exception as e:
             logger.warning(f"Failed to create backup: {e}")
     
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle only the settings; workers rebuild paths and their own I/O thread"""
+        return {
+            "cache_directory": str(self.cache_directory),
+            "max_cache_age_hours": self.max_cache_age_hours,
+            "max_backups": self.max_backups
+        }
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Recreate the manager from pickled settings"""
+        self.__init__(state["cache_directory"])
+        self.max_cache_age_hours = state["max_cache_age_hours"]
+        self.max_backups = state["max_backups"]
+    
+    def close(self) -> None:
+        """Wait for pending background backup work to finish"""
+        self._io_pool.shutdown(wait=True)
+    
+    @staticmethod
+    def _remove_file(path: Union[str, Path]) -> None:
+        """Unlink path if it exists"""
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+    
+    @staticmethod
+    def _link_or_copy(source: Path, target: Path) -> None:
+        """Hardlink source to target, copying when the filesystem cannot link"""
+        if target.exists():
+            target.unlink()
+        
+        try:
+            os.link(source, target)
+        except OSError:
+            # Timestamps live in backup names, so only the contents need copying
+            # and copyfile can use the kernel's in-place copy
+            shutil.copyfile(source, target)
+    
+    def _list_backup_timestamps(self) -> List[int]:
+        """Return backup timestamps, newest first, parsed from the data file names"""
+        prefix, suffix = "calibration_data_", ".pkl"
+        timestamps = []
+        with os.scandir(self.backup_directory) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith(prefix) and name.endswith(suffix):
+                    stamp = name[len(prefix):-len(suffix)]
+                    if stamp.isdigit():
+                        timestamps.append(int(stamp))
+        
+        timestamps.sort(reverse=True)
+        return timestamps
+    
     def _cleanup_old_backups(self) -> None:
         """Remove old backup files, keeping only the most recent ones"""
         try:
-            # Get all backup files
-            backup_files = list(self.backup_directory.glob("calibration_data_*.pkl"))
-            backup_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
-            
-            # Remove excess backups
-            for old_backup in backup_files[self.max_backups:]:
-                old_backup.unlink()
-                # Also remove corresponding metadata file
-                timestamp = old_backup.stem.split('_')[-1]
-                meta_file = self.backup_directory / f"calibration_metadata_{timestamp}.json"
-                if meta_file.exists():
-                    meta_file.unlink()
+            backup_directory = str(self.backup_directory)
+            
+            # Remove excess backups along with their metadata and homography files
+            for timestamp in self._list_backup_timestamps()[self.max_backups:]:
+                for name in (f"calibration_data_{timestamp}.pkl",
+                             f"calibration_metadata_{timestamp}.json",
+                             f"calibration_homography_{timestamp}.npy"):
+                    self._remove_file(os.path.join(backup_directory, name))
             
         except Exception as e:
             logger.warning(f"Error cleaning up old backups: {e}")
 
 
+# Fallback calibration used when no cache or backup can be recovered.
+# Standard snooker table corners (normalized coordinates that need to be scaled);
+# a real implementation would need actual frame dimensions. Kept as plain
+# coordinates so each fallback gets its own mutable Point objects
+_DEFAULT_CORNERS = (
+    (100, 100),    # Top-left
+    (700, 100),    # Top-right
+    (700, 400),    # Bottom-right
+    (100, 400)     # Bottom-left
+)
+
+# Basic homography (identity transformation), shared read-only
+_DEFAULT_HOMOGRAPHY = np.eye(3, dtype=np.float32)
+_DEFAULT_HOMOGRAPHY.setflags(write=False)
+
+# Basic pocket regions as (x1, y1, x2, y2)
+_DEFAULT_POCKETS = (
+    (90, 90, 110, 110),      # Top-left
+    (390, 90, 410, 110),     # Top-middle
+    (690, 90, 710, 110),     # Top-right
+    (90, 390, 110, 410),     # Bottom-left
+    (390, 390, 410, 410),    # Bottom-middle
+    (690, 390, 710, 410)     # Bottom-right
+)
+
 class CalibrationRecoveryManager:
     """Manages calibration recovery strategies"""
     
     def __init__(self, persistence_manager: CalibrationPersistenceManager):
         self.persistence_manager = persistence_manager
-        self.recovery_strategies = [
-            self._recover_from_cache,
-            self._recover_from_backup,
-            self._recover_with_default_parameters
-        ]
         
     def recover_calibration(self, video_source: str = "", 
                           max_cache_age_hours: float = 24) -> Optional[CalibrationData]:
-        """Attempt to recover calibration data using various strategies"""
+        """Attempt to recover calibration data using various strategies
+        
+        Strategies run cheapest first and each one bails out on a metadata
+        check before doing any payload I/O.
+        """
         logger.info("Attempting calibration recovery...")
         
-        for i, strategy in enumerate(self.recovery_strategies):
-            try:
-                calibration_data = strategy(video_source, max_cache_age_hours)
-                if calibration_data and calibration_data.is_calibrated():
-                    logger.info(f"Calibration recovered using strategy {i+1}")
-                    return calibration_data
-            except Exception as e:
-                logger.warning(f"Recovery strategy {i+1} failed: {e}")
+        # Strategy 1: recent cache, answered from metadata without reading the payload
+        try:
+            calibration_data = self._recover_from_cache(video_source, max_cache_age_hours)
+            if calibration_data and calibration_data.is_calibrated():
+                logger.info("Calibration recovered using strategy 1")
+                return calibration_data
+        except Exception as e:
+            logger.warning(f"Recovery strategy 1 failed: {e}")
+        
+        # Strategy 2: newest usable backup, skipped after one scandir if there are none
+        try:
+            calibration_data = self._recover_from_backup(video_source, max_cache_age_hours)
+            if calibration_data and calibration_data.is_calibrated():
+                logger.info("Calibration recovered using strategy 2")
+                return calibration_data
+        except Exception as e:
+            logger.warning(f"Recovery strategy 2 failed: {e}")
+        
+        # Strategy 3: default parameters (no I/O)
+        calibration_data = self._recover_with_default_parameters(video_source, max_cache_age_hours)
+        if calibration_data and calibration_data.is_calibrated():
+            logger.info("Calibration recovered using strategy 3")
+            return calibration_data
         
         logger.warning("All calibration recovery strategies failed")
         return None
     
     def _recover_from_cache(self, video_source: str, max_cache_age_hours: float) -> Optional[CalibrationData]:
         """Strategy 1: Recover from recent cache"""
-        return self.persistence_manager.load_calibration_data(max_cache_age_hours)
+        # Metadata-only check first; the payload is read lazily on first use
+        if not self.persistence_manager.is_cache_valid(max_cache_age_hours):
+            return None
+        return self.persistence_manager.load_calibration_data(max_cache_age_hours, lazy=True)
     
     def _recover_from_backup(self, video_source: str, max_cache_age_hours: float) -> Optional[CalibrationData]:
         """Strategy 2: Recover from backup files"""
         try:
-            backup_files = list(self.persistence_manager.backup_directory.glob("calibration_data_*.pkl"))
-            if not backup_files:
-                return None
+            backup_directory = self.persistence_manager.backup_directory
             
             # Try most recent backup first
-            backup_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
-            
-            for backup_file in backup_files:
+            for timestamp in self.persistence_manager._list_backup_timestamps():
+                backup_file = backup_directory / f"calibration_data_{timestamp}.pkl"
                 try:
                     with open(backup_file, 'rb') as f:
-                        serializable_data = pickle.load(f)
+                        serializable_data = _load_pickle(f)
                     
-                    calibration_data = self.persistence_manager._reconstruct_from_serialization(serializable_data)
+                    homography_file = backup_directory / f"calibration_homography_{timestamp}.npy"
+                    calibration_data = self.persistence_manager._reconstruct_from_serialization(
+                        serializable_data, homography_file
+                    )
                     
                     if calibration_data.is_calibrated():
                         logger.info(f"Recovered calibration from backup: {backup_file.name}")
@@ -313,37 +618,11 @@ class CalibrationRecoveryManager:
             # In practice, this might use standard table dimensions and camera positions
             logger.info("Creating default calibration parameters")
             
-            # Standard snooker table corners (normalized coordinates that need to be scaled)
-            # This is a fallback - real implementation would need actual frame dimensions
-            default_corners = [
-                Point(100, 100),    # Top-left
-                Point(700, 100),    # Top-right  
-                Point(700, 400),    # Bottom-right
-                Point(100, 400)     # Bottom-left
-            ]
-            
-            # Create basic homography (identity-like transformation)
-            homography = np.array([
-                [1.0, 0.0, 0.0],
-                [0.0, 1.0, 0.0],
-                [0.0, 0.0, 1.0]
-            ], dtype=np.float32)
-            
-            # Basic pocket regions
-            pocket_regions = [
-                BoundingBox(90, 90, 110, 110),      # Top-left
-                BoundingBox(390, 90, 410, 110),     # Top-middle
-                BoundingBox(690, 90, 710, 110),     # Top-right
-                BoundingBox(90, 390, 110, 410),     # Bottom-left
-                BoundingBox(390, 390, 410, 410),    # Bottom-middle
-                BoundingBox(690, 390, 710, 410)     # Bottom-right
-            ]
-            
             calibration_data = CalibrationData(
-                homography_matrix=homography,
-                table_corners=default_corners,
+                homography_matrix=_DEFAULT_HOMOGRAPHY,
+                table_corners=[Point(x, y) for x, y in _DEFAULT_CORNERS],
                 table_dimensions=(3.569, 1.778),  # Standard snooker table
-                pocket_regions=pocket_regions,
+                pocket_regions=[BoundingBox(*bounds) for bounds in _DEFAULT_POCKETS],
                 calibration_timestamp=time.time(),
                 is_valid=False  # Mark as invalid since it's just a fallback
             )
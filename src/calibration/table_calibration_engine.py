@@ -3,20 +3,142 @@
 Table Calibration Engine for snooker table geometry detection
 """
 
+import copy
 import logging
+import math
+import os
+import queue
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import List, Optional, Tuple
 import numpy as np
 import cv2
 
+# Optional numba import for compiled line kernels
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
 from ..core import ICalibrationEngine, CalibrationData, Point, BoundingBox, CalibrationConfig
 from .calibration_persistence import CalibrationPersistenceManager, CalibrationRecoveryManager
 
 logger = logging.getLogger(__name__)
 
+def _intersect(rho1, theta1, rho2, theta2):
+    """Intersect two polar lines, returning (x, y, ok); ok is False for parallel lines"""
+    cos_theta1, sin_theta1 = math.cos(theta1), math.sin(theta1)
+    cos_theta2, sin_theta2 = math.cos(theta2), math.sin(theta2)
+    
+    det = cos_theta1 * sin_theta2 - sin_theta1 * cos_theta2
+    if abs(det) < 1e-6:
+        return 0.0, 0.0, False
+    
+    x = (sin_theta2 * rho1 - sin_theta1 * rho2) / det
+    y = (cos_theta1 * rho2 - cos_theta2 * rho1) / det
+    return x, y, True
+
+def _dedupe_line_indices(rhos, threshold):
+    """Indices of lines kept after dropping those within threshold of a kept line, in |rho| order"""
+    order = np.argsort(np.abs(rhos), kind='mergesort')
+    kept = np.empty(order.shape[0], dtype=np.int64)
+    count = 0
+    for i in order:
+        is_duplicate = False
+        for j in range(count):
+            if abs(rhos[i] - rhos[kept[j]]) < threshold:
+                is_duplicate = True
+                break
+        if not is_duplicate:
+            kept[count] = i
+            count += 1
+    return kept[:count]
+
+def _order_corner_array(points):
+    """Order (N, 2) points clockwise from top-left; four extremes, or all points by angle on ties"""
+    # Extremes of x + y and y - x pick top-left/bottom-right and top-right/bottom-left
+    sums = points[:, 0] + points[:, 1]
+    diffs = points[:, 1] - points[:, 0]
+    picks = np.array([sums.argmin(), diffs.argmin(), sums.argmax(), diffs.argmax()])
+    distinct = True
+    for i in range(4):
+        for j in range(i + 1, 4):
+            if picks[i] == picks[j]:
+                distinct = False
+    if distinct:
+        return points[picks]
+    
+    # Ties (e.g. an outline rotated by 45 degrees) fall back to sorting by angle
+    centroid_x, centroid_y = points[:, 0].mean(), points[:, 1].mean()
+    angles = np.arctan2(points[:, 1] - centroid_y, points[:, 0] - centroid_x)
+    return points[np.argsort(angles, kind='mergesort')]
+
+def _corners_from_lines(lines, duplicate_threshold):
+    """Classify, dedupe, intersect and order (N, 2) rho/theta lines into (4, 2) corners, or (0, 2)"""
+    count = lines.shape[0]
+    horizontal = np.empty((count, 2))
+    vertical = np.empty((count, 2))
+    horizontal_count = 0
+    vertical_count = 0
+    for i in range(count):
+        angle_deg = math.degrees(lines[i, 1])
+        if abs(angle_deg) < 20 or abs(angle_deg - 180) < 20:
+            horizontal[horizontal_count] = lines[i]
+            horizontal_count += 1
+        elif abs(angle_deg - 90) < 20:
+            vertical[vertical_count] = lines[i]
+            vertical_count += 1
+    
+    no_corners = np.empty((0, 2))
+    if horizontal_count < 2 or vertical_count < 2:
+        return no_corners
+    horizontal_kept = _dedupe_line_indices(horizontal[:horizontal_count, 0].copy(), duplicate_threshold)
+    vertical_kept = _dedupe_line_indices(vertical[:vertical_count, 0].copy(), duplicate_threshold)
+    if horizontal_kept.shape[0] < 2 or vertical_kept.shape[0] < 2:
+        return no_corners
+    
+    # Rows follow the horizontal lines, as in _find_line_intersections
+    points = np.empty((horizontal_kept.shape[0] * vertical_kept.shape[0], 2))
+    point_count = 0
+    for i in horizontal_kept:
+        for j in vertical_kept:
+            x, y, ok = _intersect(horizontal[i, 0], horizontal[i, 1], vertical[j, 0], vertical[j, 1])
+            if ok:
+                points[point_count, 0] = x
+                points[point_count, 1] = y
+                point_count += 1
+    if point_count < 4:
+        return no_corners
+    
+    return _order_corner_array(points[:point_count])[:4]
+
+if HAS_NUMBA:
+    _intersect = njit(cache=True)(_intersect)
+    _dedupe_line_indices = njit(cache=True)(_dedupe_line_indices)
+    _order_corner_array = njit(cache=True)(_order_corner_array)
+    _corners_from_lines = njit(cache=True)(_corners_from_lines)
+
+def _warm_corner_kernel() -> None:
+    """Compile (or load from cache) the corner kernel for the float64 lines it is called with"""
+    _corners_from_lines(np.empty((0, 2)), 30.0)
+
 class TableCalibrationEngine(ICalibrationEngine):
     """Detects snooker table geometry and calculates calibration data"""
     
+    # Recent corner detections kept, keyed by a downsampled frame fingerprint
+    CORNER_CACHE_SIZE = 8
+    # Padding around the calibrated corners for region-restricted re-detection
+    ROI_MARGIN = 30
+    # Bits of the 8x8 table-region average hash that may differ before corners are re-detected
+    ROI_HASH_DISTANCE = 12
+    # Wider frames are downsampled to this width before edge and line detection
+    DETECTION_WIDTH = 960
+    # Scratch images kept per (stage, shape): full frame, table region and downsampled sizes
+    SCRATCH_BUFFER_LIMIT = 12
+    
     def __init__(self, config: CalibrationConfig, cache_directory: str = "cache/calibration"):
         self.config = config
         self.calibration_data = CalibrationData()
@@ -26,6 +148,13 @@ class TableCalibrationEngine(ICalibrationEngine):
         # Initialize persistence and recovery managers
         self.persistence_manager = CalibrationPersistenceManager(cache_directory)
         self.recovery_manager = CalibrationRecoveryManager(self.persistence_manager)
+        # Calibration saves run on one background thread so disk writes overlap the next frame
+        self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="calibration-save")
+        self._pending_save: Optional[Future] = None
+        
+        # Compile the corner kernel here rather than at import or on the first frame
+        if HAS_NUMBA:
+            _warm_corner_kernel()
         
         # Try to load existing calibration data
         self._load_cached_calibration()
@@ -40,74 +169,213 @@ class TableCalibrationEngine(ICalibrationEngine):
             (1.0, 1.0)     # Bottom-right
         ]
         
-        # Camera angle change detection
-        self.previous_corners = None
+        # Camera angle change detection; corners of the last calibration as (4, 2) float32
+        self._corners_np: Optional[np.ndarray] = None
         self.corner_change_threshold = 50.0  # pixels
+        # Table region (x1, y1, x2, y2) from the last successful calibration
+        self._last_roi: Optional[Tuple[int, int, int, int]] = None
+        # Average hash of the table region in the calibration frame
+        self._roi_hash: Optional[int] = None
+        self._corner_cache: "OrderedDict[bytes, List[Point]]" = OrderedDict()
+        self._corner_cache_lock = threading.Lock()
+        # Reused uint8 images for the detection stages, one set per detecting thread
+        self._thread_state = threading.local()
+        # Worker pool for batch calibration, created on first use
+        self._detect_pool: Optional[ThreadPoolExecutor] = None
+        self._morph_kernel = np.ones((3, 3), np.uint8)
+        # Drawing geometry for visualize_calibration, rebuilt when calibration data changes
+        self._overlay_source: Optional[CalibrationData] = None
+        self._overlay: tuple = ()
+        
+        # GPU line detection when OpenCV has CUDA and a device is present
+        self._cuda_filters = self._init_cuda_filters()
+        self._gpu_gray = cv2.cuda_GpuMat() if self._cuda_filters is not None else None
     
     def detect_table_corners(self, frame: np.ndarray) -> List[Point]:
         """Detect table corner points using edge and line detection"""
         try:
             # Convert to grayscale
-            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-            
-            # Apply Gaussian blur to reduce noise
-            blurred = cv2.GaussianBlur(gray, (5, 5), 0)
-            
-            # Edge detection
-            edges = cv2.Canny(blurred, 50, 150, apertureSize=3)
+            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=self._scratch('gray', frame.shape[:2]))
+            
+            # Near-identical frames share a 16x16 fingerprint; reuse their corners
+            key = np.array(gray.shape, dtype=np.int32).tobytes() + \
+                cv2.resize(gray, (16, 16), interpolation=cv2.INTER_AREA).tobytes()
+            with self._corner_cache_lock:
+                cached = self._corner_cache.get(key)
+                if cached is not None:
+                    self._corner_cache.move_to_end(key)
+                    return list(cached)
+            
+            # Line detection cost scales with pixel count; corners are rescaled afterwards
+            scale = max(1.0, gray.shape[1] / self.DETECTION_WIDTH)
+            if not self._looks_like_table(frame):
+                # Without green felt dominating the frame cannot show the table; skip Canny/Hough
+                logger.debug("Frame rejected before corner detection: no dominant green")
+                corners = []
+            elif scale > 1.0:
+                size = (int(round(gray.shape[1] / scale)), int(round(gray.shape[0] / scale)))
+                small = cv2.resize(gray, size, dst=self._scratch('small', size[::-1]),
+                                   interpolation=cv2.INTER_AREA)
+                corners = [Point(p.x * scale, p.y * scale)
+                           for p in self._detect_corners_in_gray(small, scale)]
+            else:
+                corners = self._detect_corners_in_gray(gray)
             
-            # Morphological operations to clean up edges
-            kernel = np.ones((3, 3), np.uint8)
-            edges = cv2.morphologyEx(edges, cv2.MORPH_CLOSE, kernel)
+            with self._corner_cache_lock:
+                self._corner_cache[key] = corners
+                if len(self._corner_cache) > self.CORNER_CACHE_SIZE:
+                    self._corner_cache.popitem(last=False)
+            return list(corners)
             
-            # Detect lines using Hough transform
-            lines = cv2.HoughLines(edges, 1, np.pi/180, threshold=100)
+        except Exception as e:
+            logger.error(f"Corner detection failed: {e}")
+            return []
+    
+    def _looks_like_table(self, frame: np.ndarray) -> bool:
+        """Cheap 32x32 check that green dominates the frame's blue and red channels"""
+        ratio = self.config.green_dominance_ratio
+        if ratio <= 0 or frame.ndim != 3 or frame.shape[2] != 3:
+            return True
+        
+        tiny = cv2.resize(frame, (32, 32), interpolation=cv2.INTER_AREA)
+        blue, green, red = cv2.mean(tiny)[:3]
+        return green >= blue * ratio and green >= red * ratio
+    
+    def _detect_corners_in_gray(self, gray: np.ndarray, scale: float = 1.0) -> List[Point]:
+        """Run edge and line detection on a grayscale frame downsampled by scale"""
+        try:
+            # Hough votes and rho spacing are in pixels, so they shrink with the frame
+            votes = max(20, int(round(100 / scale)))
+            lines = None
+            if self._cuda_filters is not None:
+                lines = self._detect_lines_cuda(gray, votes)
+            if self._cuda_filters is None:
+                lines = self._detect_lines_cpu(gray, votes)
             
             if lines is None or len(lines) < 4:
                 logger.warning("Insufficient lines detected for table corner detection")
                 return []
             
-            # Filter and group lines
-            horizontal_lines, vertical_lines = self._filter_lines(lines)
+            # Group lines, intersect and order the corners in one compiled pass
+            line_array = np.ascontiguousarray(lines, dtype=np.float64).reshape(-1, 2)
+            corners = _corners_from_lines(line_array, 30.0 / scale)
             
-            if len(horizontal_lines) < 2 or len(vertical_lines) < 2:
-                logger.warning("Insufficient horizontal or vertical lines detected")
+            if len(corners) < 4:
+                logger.warning("Detected lines do not outline a table")
                 return []
             
-            # Find intersections to get corner points
-            corners = self._find_line_intersections(horizontal_lines, vertical_lines)
-            
-            # Validate and order corners
-            if len(corners) >= 4:
-                ordered_corners = self._order_corners(corners)
-                return ordered_corners[:4]  # Return top 4 corners
-            
-            return []
+            return Point.from_array(corners)
             
         except Exception as e:
             logger.error(f"Corner detection failed: {e}")
             return []
     
-    def _filter_lines(self, lines: np.ndarray) -> Tuple[List[Tuple[float, float]], List[Tuple[float, float]]]:
-        """Filter and categorize lines into horizontal and vertical"""
-        horizontal_lines = []
-        vertical_lines = []
+    def _detect_lines_cpu(self, gray: np.ndarray, votes: int = 100) -> Optional[np.ndarray]:
+        """Canny, close and segment Hough on the CPU; lines as (N, 1, 2) rho/theta"""
+        shape = gray.shape[:2]
         
-        for line in lines:
-            rho, theta = line[0]
-            
-            # Convert to degrees
-            angle_deg = np.degrees(theta)
+        # Optional Gaussian blur for noisy sources; clean frames go straight to Canny
+        if self.config.pre_blur:
+            gray = cv2.GaussianBlur(gray, (5, 5), 0, dst=self._scratch('blur', shape))
+        
+        # Edge detection
+        edges = cv2.Canny(gray, 50, 150, edges=self._scratch('edges', shape), apertureSize=3)
+        
+        # Morphological operations to clean up edges
+        edges = cv2.morphologyEx(edges, cv2.MORPH_CLOSE, self._morph_kernel,
+                                 dst=self._scratch('closed', shape))
+        
+        # Probabilistic Hough keeps only long edge segments, so far fewer near-duplicates
+        segments = cv2.HoughLinesP(edges, 1, np.pi/180, threshold=votes,
+                                   minLineLength=min(shape) // 4, maxLineGap=20)
+        return self._segments_to_polar(segments)
+    
+    @staticmethod
+    def _segments_to_polar(segments: Optional[np.ndarray]) -> Optional[np.ndarray]:
+        """Convert (N, 1, 4) x1, y1, x2, y2 segments to HoughLines-style (N, 1, 2) rho/theta"""
+        if segments is None or not segments.size:
+            return None
+        
+        segments = segments.reshape(-1, 4).astype(np.float64)
+        # Normal angle in [0, pi) with signed rho, matching cv2.HoughLines
+        theta = (np.arctan2(segments[:, 3] - segments[:, 1], segments[:, 2] - segments[:, 0]) + np.pi / 2) % np.pi
+        rho = segments[:, 0] * np.cos(theta) + segments[:, 1] * np.sin(theta)
+        return np.column_stack((rho, theta)).astype(np.float32).reshape(-1, 1, 2)
+    
+    def _scratch(self, stage: str, shape: Tuple[int, int]) -> np.ndarray:
+        """Return the reusable uint8 image for a detection stage at the given size"""
+        buffers = getattr(self._thread_state, 'scratch', None)
+        if buffers is None:
+            buffers = self._thread_state.scratch = OrderedDict()
+        
+        key = (stage, tuple(shape))
+        buffer = buffers.get(key)
+        if buffer is None:
+            buffer = np.empty(key[1], dtype=np.uint8)
+            buffers[key] = buffer
+            if len(buffers) > self.SCRATCH_BUFFER_LIMIT:
+                buffers.popitem(last=False)
+        else:
+            buffers.move_to_end(key)
+        return buffer
+    
+    def _init_cuda_filters(self) -> Optional[tuple]:
+        """Build the GPU blur/Canny/close/Hough stages, or None without a CUDA device
+        
+        The blur stage is None unless the config asks for pre_blur.
+        """
+        try:
+            if not hasattr(cv2, 'cuda') or cv2.cuda.getCudaEnabledDeviceCount() == 0:
+                return None
             
-            # Classify as horizontal or vertical based on angle
-            if abs(angle_deg) < 20 or abs(angle_deg - 180) < 20:
-                horizontal_lines.append((rho, theta))
-            elif abs(angle_deg - 90) < 20:
-                vertical_lines.append((rho, theta))
+            filters = (
+                cv2.cuda.createGaussianFilter(cv2.CV_8UC1, cv2.CV_8UC1, (5, 5), 0)
+                if self.config.pre_blur else None,
+                cv2.cuda.createCannyEdgeDetector(50, 150, 3),
+                cv2.cuda.createMorphologyFilter(cv2.MORPH_CLOSE, cv2.CV_8UC1, np.ones((3, 3), np.uint8)),
+                cv2.cuda.createHoughSegmentDetector(1, np.pi/180, 50, 20)
+            )
+            logger.info("Using CUDA for table edge and line detection")
+            return filters
+            
+        except (cv2.error, AttributeError) as e:
+            logger.debug(f"CUDA line detection unavailable: {e}")
+            return None
+    
+    def _detect_lines_cuda(self, gray: np.ndarray, votes: int = 100) -> Optional[np.ndarray]:
+        """GPU version of _detect_lines_cpu; disables CUDA and returns None on failure"""
+        try:
+            blur, canny, close, hough = self._cuda_filters
+            # The device buffer is reused and only reallocated when the frame size changes
+            self._gpu_gray.upload(gray)
+            source = blur.apply(self._gpu_gray) if blur is not None else self._gpu_gray
+            edges = close.apply(canny.detect(source))
+            
+            # Only the compact segment list comes back to the host
+            hough.setThreshold(votes)
+            hough.setMinLineLength(min(gray.shape[:2]) // 4)
+            return self._segments_to_polar(hough.detect(edges).download())
+            
+        except cv2.error as e:
+            logger.warning(f"CUDA line detection failed, falling back to CPU: {e}")
+            self._cuda_filters = None
+            return None
+    
+    def _filter_lines(self, lines: np.ndarray,
+                      duplicate_threshold: float = 30) -> Tuple[List[Tuple[float, float]], List[Tuple[float, float]]]:
+        """Filter and categorize lines into horizontal and vertical"""
+        # Classify every line at once by its angle in degrees
+        line_array = np.asarray(lines, dtype=np.float64).reshape(-1, 2)
+        angle_deg = np.degrees(line_array[:, 1])
+        horizontal_mask = (np.abs(angle_deg) < 20) | (np.abs(angle_deg - 180) < 20)
+        vertical_mask = np.abs(angle_deg - 90) < 20
+        
+        horizontal_lines = [tuple(line) for line in line_array[horizontal_mask].tolist()]
+        vertical_lines = [tuple(line) for line in line_array[vertical_mask].tolist()]
         
         # Remove duplicate lines (similar rho values)
-        horizontal_lines = self._remove_duplicate_lines(horizontal_lines)
-        vertical_lines = self._remove_duplicate_lines(vertical_lines)
+        horizontal_lines = self._remove_duplicate_lines(horizontal_lines, duplicate_threshold)
+        vertical_lines = self._remove_duplicate_lines(vertical_lines, duplicate_threshold)
         
         return horizontal_lines, vertical_lines
     
@@ -116,54 +384,37 @@ class TableCalibrationEngine(ICalibrationEngine):
         if not lines:
             return []
         
-        # Sort by rho value
-        lines.sort(key=lambda x: abs(x[0]))
-        
-        filtered_lines = [lines[0]]
-        
-        for rho, theta in lines[1:]:
-            # Check if this line is too close to any existing line
-            is_duplicate = False
-            for existing_rho, existing_theta in filtered_lines:
-                if abs(rho - existing_rho) < threshold:
-                    is_duplicate = True
-                    break
-            
-            if not is_duplicate:
-                filtered_lines.append((rho, theta))
-        
-        return filtered_lines
+        # Lines are scanned in order of |rho|; the first of each close group is kept
+        line_array = np.asarray(lines, dtype=np.float64)
+        kept = _dedupe_line_indices(np.ascontiguousarray(line_array[:, 0]), float(threshold))
+        return [lines[i] for i in kept]
     
     def _find_line_intersections(self, horizontal_lines: List[Tuple[float, float]], 
                                 vertical_lines: List[Tuple[float, float]]) -> List[Point]:
         """Find intersection points between horizontal and vertical lines"""
-        intersections = []
+        if not horizontal_lines or not vertical_lines:
+            return []
         
-        for h_rho, h_theta in horizontal_lines:
-            for v_rho, v_theta in vertical_lines:
-                intersection = self._line_intersection(h_rho, h_theta, v_rho, v_theta)
-                if intersection:
-                    intersections.append(intersection)
+        # Solve every horizontal/vertical pair at once; rows follow the horizontal lines
+        h = np.asarray(horizontal_lines, dtype=np.float64)
+        v = np.asarray(vertical_lines, dtype=np.float64)
+        cos_h, sin_h = np.cos(h[:, 1:2]), np.sin(h[:, 1:2])
+        cos_v, sin_v = np.cos(v[:, 1]), np.sin(v[:, 1])
+        rho_h, rho_v = h[:, 0:1], v[:, 0]
         
-        return intersections
+        det = cos_h * sin_v - sin_h * cos_v
+        valid = np.abs(det) >= 1e-6  # Parallel pairs have no intersection
+        with np.errstate(divide='ignore', invalid='ignore'):
+            x = (sin_v * rho_h - sin_h * rho_v) / det
+            y = (cos_h * rho_v - cos_v * rho_h) / det
+        
+        return Point.from_array(np.column_stack((x[valid], y[valid])))
     
     def _line_intersection(self, rho1: float, theta1: float, rho2: float, theta2: float) -> Optional[Point]:
         """Calculate intersection point of two lines in polar form"""
         try:
-            # Convert polar to cartesian form
-            cos_theta1, sin_theta1 = np.cos(theta1), np.sin(theta1)
-            cos_theta2, sin_theta2 = np.cos(theta2), np.sin(theta2)
-            
-            # Solve system of equations
-            det = cos_theta1 * sin_theta2 - sin_theta1 * cos_theta2
-            
-            if abs(det) < 1e-6:  # Lines are parallel
-                return None
-            
-            x = (sin_theta2 * rho1 - sin_theta1 * rho2) / det
-            y = (cos_theta1 * rho2 - cos_theta2 * rho1) / det
-            
-            return Point(x, y)
+            x, y, ok = _intersect(float(rho1), float(theta1), float(rho2), float(theta2))
+            return Point(x, y) if ok else None
             
         except Exception:
             return None
@@ -173,22 +424,8 @@ class TableCalibrationEngine(ICalibrationEngine):
         if len(corners) < 4:
             return corners
         
-        # Convert to numpy array for easier manipulation
-        points = np.array([(p.x, p.y) for p in corners])
-        
-        # Find centroid
-        centroid = np.mean(points, axis=0)
-        
-        # Calculate angles from centroid
-        angles = np.arctan2(points[:, 1] - centroid[1], points[:, 0] - centroid[0])
-        
-        # Sort by angle
-        sorted_indices = np.argsort(angles)
-        
-        # Order: top-left, top-right, bottom-right, bottom-left
-        ordered_points = points[sorted_indices]
-        
-        return [Point(x, y) for x, y in ordered_points]
+        points = np.array([(p.x, p.y) for p in corners], dtype=np.float64)
+        return Point.from_array(_order_corner_array(points))
     
     def calculate_homography(self, corners: List[Point]) -> Optional[np.ndarray]:
         """Calculate homography transformation matrix from detected corners"""
@@ -198,7 +435,7 @@ class TableCalibrationEngine(ICalibrationEngine):
         
         try:
             # Source points (detected corners)
-            src_points = np.array([[p.x, p.y] for p in corners], dtype=np.float32)
+            src_points = self._corner_array(corners)
             
             # Destination points (standard rectangle)
             # Assuming table dimensions in meters, scale to reasonable pixel size
@@ -230,6 +467,14 @@ class TableCalibrationEngine(ICalibrationEngine):
                            dst_points: np.ndarray, max_error: float = 10.0) -> bool:
         """Validate homography by checking reprojection error"""
         try:
+            # A near-singular linear part means a degenerate mapping that reprojection can miss
+            if homography[2, 2] == 0:
+                return False
+            linear = homography[:2, :2] / homography[2, 2]
+            if abs(linear[0, 0] * linear[1, 1] - linear[0, 1] * linear[1, 0]) <= 1e-3:
+                logger.debug("Homography rejected: degenerate linear part")
+                return False
+            
             # Transform source points using homography
             transformed_points = cv2.perspectiveTransform(
                 src_points.reshape(-1, 1, 2), homography
@@ -241,7 +486,7 @@ class TableCalibrationEngine(ICalibrationEngine):
             
             logger.debug(f"Homography reprojection error: {mean_error:.2f}")
             
-            return mean_error < max_error
+            return bool(mean_error < max_error)
             
         except Exception as e:
             logger.error(f"Homography validation failed: {e}")
@@ -251,6 +496,22 @@ class TableCalibrationEngine(ICalibrationEngine):
         """Check if calibration is valid"""
         return self.calibration_data.is_calibrated()
     
+    @property
+    def previous_corners(self) -> Optional[List[Point]]:
+        """Corners of the last successful calibration"""
+        if self._corners_np is None:
+            return None
+        return [Point(float(x), float(y)) for x, y in self._corners_np]
+    
+    @previous_corners.setter
+    def previous_corners(self, corners: Optional[List[Point]]) -> None:
+        self._corners_np = None if corners is None else self._corner_array(corners)
+    
+    @staticmethod
+    def _corner_array(corners: List[Point]) -> np.ndarray:
+        """Corner points as an (N, 2) float32 array"""
+        return np.array([(p.x, p.y) for p in corners], dtype=np.float32).reshape(-1, 2)
+    
     def get_calibration_data(self) -> CalibrationData:
         """Get current calibration data"""
         return self.calibration_data
@@ -260,6 +521,8 @@ class TableCalibrationEngine(ICalibrationEngine):
         self.calibration_data = CalibrationData()
         self.last_calibration_frame = -1
         self.calibration_attempts = 0
+        self._last_roi = None
+        self._roi_hash = None
         logger.info("Calibration data reset")
     
     def calibrate_frame(self, frame: np.ndarray, frame_number: int = 0, 
@@ -298,8 +561,19 @@ class TableCalibrationEngine(ICalibrationEngine):
                 return self._attempt_calibration_recovery(video_source)
             return False
         
+        self._apply_calibration(corners, homography, frame, frame_number, video_source)
+        logger.info(f"Table calibration successful on attempt {self.calibration_attempts}")
+        return True
+    
+    def _apply_calibration(self, corners: List[Point], homography: np.ndarray, frame: np.ndarray,
+                           frame_number: int, video_source: str) -> None:
+        """Install a successful calibration and save it in the background"""
+        frame_shape = frame.shape
+        # Hotpaths below work on the array; Point lists stay at the public API
+        self._corners_np = self._corner_array(corners)
+        
         # Generate pocket regions
-        pocket_regions = self._generate_pocket_regions(corners, frame.shape)
+        pocket_regions = self._generate_pocket_regions(self._corners_np, frame_shape)
         
         # Update calibration data
         self.calibration_data = CalibrationData(
@@ -312,62 +586,168 @@ class TableCalibrationEngine(ICalibrationEngine):
         )
         
         self.last_calibration_frame = frame_number
-        self.previous_corners = corners.copy()
+        self._last_roi = self._corner_roi(self._corners_np, frame_shape)
+        self._roi_hash = self._region_hash(frame, self._last_roi)
         
-        # Save calibration data for future use
-        self.persistence_manager.save_calibration_data(
-            self.calibration_data, video_source, frame_number
+        # Save calibration data for future use; the copy keeps later resets out of the write
+        self._pending_save = self._io_pool.submit(
+            self.persistence_manager.save_calibration_data,
+            copy.deepcopy(self.calibration_data), video_source, frame_number
         )
+    
+    def calibrate_frames_batch(self, frames: List[np.ndarray], frame_numbers: Optional[List[int]] = None,
+                               video_source: str = "") -> bool:
+        """Detect corners on several candidate frames in parallel and calibrate from the best
+        
+        The winner is the candidate with a valid homography whose corners sit closest
+        to the per-corner median of all candidates, which discards outlier detections.
+        """
+        if not frames:
+            return False
+        if frame_numbers is None:
+            frame_numbers = list(range(len(frames)))
         
-        logger.info(f"Table calibration successful on attempt {self.calibration_attempts}")
+        self.calibration_attempts += 1
+        
+        # OpenCV releases the GIL, so threads scale; the shared GPU path runs frames in turn
+        if self._cuda_filters is None and len(frames) > 1:
+            if self._detect_pool is None:
+                self._detect_pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 1,
+                                                       thread_name_prefix="calibration-detect")
+            detections = list(self._detect_pool.map(self.detect_table_corners, frames))
+        else:
+            detections = [self.detect_table_corners(frame) for frame in frames]
+        
+        candidates = []
+        for index, corners in enumerate(detections):
+            if len(corners) < 4:
+                continue
+            homography = self.calculate_homography(corners)
+            if homography is not None:
+                candidates.append((index, corners, homography))
+        
+        if not candidates:
+            logger.debug(f"Batch calibration attempt {self.calibration_attempts}: no usable frame")
+            return False
+        
+        corner_sets = np.array([[(p.x, p.y) for p in corners] for _, corners, _ in candidates])
+        spread = np.linalg.norm(corner_sets - np.median(corner_sets, axis=0), axis=2).mean(axis=1)
+        index, corners, homography = candidates[int(spread.argmin())]
+        
+        self._apply_calibration(corners, homography, frames[index], frame_numbers[index], video_source)
+        logger.info(f"Table calibration successful from frame {frame_numbers[index]} "
+                    f"of a batch of {len(frames)}")
         return True
     
-    def _generate_pocket_regions(self, corners: List[Point], frame_shape: tuple) -> List[BoundingBox]:
-        """Generate pocket regions based on table corners"""
+    def _corner_roi(self, corners, frame_shape: tuple) -> Tuple[int, int, int, int]:
+        """Bounding box of the corners (Points or an (N, 2) array) padded by ROI_MARGIN, clipped to the frame"""
+        points = corners if isinstance(corners, np.ndarray) else self._corner_array(corners)
+        (min_x, min_y), (max_x, max_y) = points.min(axis=0), points.max(axis=0)
+        x1 = max(0, int(min_x) - self.ROI_MARGIN)
+        y1 = max(0, int(min_y) - self.ROI_MARGIN)
+        x2 = min(frame_shape[1], int(max_x) + self.ROI_MARGIN + 1)
+        y2 = min(frame_shape[0], int(max_y) + self.ROI_MARGIN + 1)
+        return x1, y1, x2, y2
+    
+    def calibrate_stream(self, capture, video_source: str = "", max_frames: Optional[int] = None) -> bool:
+        """Calibrate from a cv2.VideoCapture-like source, decoding ahead on a reader thread
+        
+        Returns True as soon as a frame calibrates successfully, False if the
+        stream ends (or max_frames are consumed) first.
+        """
+        frames: queue.Queue = queue.Queue(maxsize=2)
+        stop = threading.Event()
+        
+        def read_frames() -> None:
+            count = 0
+            while not stop.is_set() and (max_frames is None or count < max_frames):
+                ret, frame = capture.read()
+                if not ret:
+                    break
+                # Bounded queue: wait for the consumer, but notice an early stop
+                while not stop.is_set():
+                    try:
+                        frames.put(frame, timeout=0.1)
+                        break
+                    except queue.Full:
+                        continue
+                count += 1
+            frames.put(None)
+        
+        reader = threading.Thread(target=read_frames, name="calibration-reader", daemon=True)
+        reader.start()
+        
+        try:
+            frame_number = 0
+            while True:
+                frame = frames.get()
+                if frame is None:
+                    return False
+                if self.calibrate_frame(frame, frame_number, video_source) and self.is_calibrated():
+                    return True
+                frame_number += 1
+        finally:
+            stop.set()
+            # Unblock the reader if it is waiting to hand over its final frame
+            while reader.is_alive():
+                try:
+                    frames.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+    
+    def flush_pending_saves(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the last background calibration save; False if it failed or timed out"""
+        pending = self._pending_save
+        if pending is None:
+            return True
+        
+        try:
+            return bool(pending.result(timeout=timeout))
+        except Exception as e:
+            logger.error(f"Background calibration save failed: {e}")
+            return False
+    
+    def close(self) -> None:
+        """Finish pending saves and stop the background I/O threads"""
+        if self._detect_pool is not None:
+            self._detect_pool.shutdown(wait=True)
+            self._detect_pool = None
+        self._io_pool.shutdown(wait=True)
+        self.persistence_manager.close()
+    
+    def _generate_pocket_regions(self, corners, frame_shape: tuple) -> List[BoundingBox]:
+        """Generate pocket regions based on table corners (Points or an (N, 2) array)"""
         if len(corners) != 4:
             return []
         
-        pocket_regions = []
-        
         # Calculate pocket positions based on table corners
         # This is a simplified approach - in practice, you might want more sophisticated pocket detection
         
         # Get table boundaries
-        min_x = min(p.x for p in corners)
-        max_x = max(p.x for p in corners)
-        min_y = min(p.y for p in corners)
-        max_y = max(p.y for p in corners)
-        
-        table_width = max_x - min_x
-        table_height = max_y - min_y
-        
-        # Pocket size (as fraction of table dimensions)
-        pocket_size_x = table_width * 0.05  # 5% of table width
-        pocket_size_y = table_height * 0.08  # 8% of table height
-        
-        # Define pocket positions (6 pockets)
-        pocket_positions = [
-            (min_x, min_y),  # Top-left
-            (min_x + table_width/2, min_y),  # Top-middle
-            (max_x, min_y),  # Top-right
-            (min_x, max_y),  # Bottom-left
-            (min_x + table_width/2, max_y),  # Bottom-middle
-            (max_x, max_y)   # Bottom-right
-        ]
+        points = corners if isinstance(corners, np.ndarray) else self._corner_array(corners)
+        (min_x, min_y), (max_x, max_y) = points.min(axis=0), points.max(axis=0)
+        mid_x = min_x + (max_x - min_x) / 2
         
-        for px, py in pocket_positions:
-            x1 = max(0, int(px - pocket_size_x/2))
-            y1 = max(0, int(py - pocket_size_y/2))
-            x2 = min(frame_shape[1], int(px + pocket_size_x/2))
-            y2 = min(frame_shape[0], int(py + pocket_size_y/2))
-            
-            pocket_regions.append(BoundingBox(x1, y1, x2, y2))
+        # Pocket size (as fraction of table dimensions): 5% of width, 8% of height
+        half_size = np.array([(max_x - min_x) * 0.05, (max_y - min_y) * 0.08]) / 2
+        
+        # Define pocket positions (6 pockets): top-left, top-middle, top-right,
+        # bottom-left, bottom-middle, bottom-right
+        centers = np.array([
+            [min_x, min_y], [mid_x, min_y], [max_x, min_y],
+            [min_x, max_y], [mid_x, max_y], [max_x, max_y]
+        ])
+        
+        # Truncate toward zero like int(), then clip every box to the frame at once
+        top_left = np.maximum((centers - half_size).astype(np.int64), 0)
+        bottom_right = np.minimum((centers + half_size).astype(np.int64), [frame_shape[1], frame_shape[0]])
+        pocket_regions = BoundingBox.from_array(np.hstack((top_left, bottom_right)))
         
         return pocket_regions
     
-    def visualize_calibration(self, frame: np.ndarray) -> np.ndarray:
-        """Draw calibration visualization on frame"""
-        vis_frame = frame.copy()
+    def visualize_calibration(self, frame: np.ndarray, in_place: bool = False) -> np.ndarray:
+        """Draw calibration visualization on frame (on the frame itself when in_place)"""
+        vis_frame = frame if in_place else frame.copy()
         
         if not self.is_calibrated():
             # Draw "Not Calibrated" message
@@ -375,22 +755,22 @@ class TableCalibrationEngine(ICalibrationEngine):
                        cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 0, 255), 2)
             return vis_frame
         
+        corner_pixels, corner_polygon, pocket_boxes = self._calibration_overlay()
+        
         # Draw table corners
-        corners = self.calibration_data.table_corners
-        if corners:
-            for i, corner in enumerate(corners):
-                cv2.circle(vis_frame, (int(corner.x), int(corner.y)), 8, (0, 255, 0), -1)
-                cv2.putText(vis_frame, f"C{i+1}", (int(corner.x)+10, int(corner.y)-10),
+        if corner_pixels:
+            for i, (x, y) in enumerate(corner_pixels):
+                cv2.circle(vis_frame, (x, y), 8, (0, 255, 0), -1)
+                cv2.putText(vis_frame, f"C{i+1}", (x+10, y-10),
                            cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 1)
             
             # Draw table boundary
-            corner_points = np.array([[int(c.x), int(c.y)] for c in corners], np.int32)
-            cv2.polylines(vis_frame, [corner_points], True, (0, 255, 0), 2)
+            cv2.polylines(vis_frame, [corner_polygon], True, (0, 255, 0), 2)
         
         # Draw pocket regions
-        for i, pocket in enumerate(self.calibration_data.pocket_regions):
-            cv2.rectangle(vis_frame, (pocket.x1, pocket.y1), (pocket.x2, pocket.y2), (255, 0, 0), 2)
-            cv2.putText(vis_frame, f"P{i+1}", (pocket.x1, pocket.y1-5),
+        for i, (top_left, bottom_right) in enumerate(pocket_boxes):
+            cv2.rectangle(vis_frame, top_left, bottom_right, (255, 0, 0), 2)
+            cv2.putText(vis_frame, f"P{i+1}", (top_left[0], top_left[1]-5),
                        cv2.FONT_HERSHEY_SIMPLEX, 0.4, (255, 0, 0), 1)
         
         # Draw calibration info
@@ -399,9 +779,25 @@ class TableCalibrationEngine(ICalibrationEngine):
         
         return vis_frame
     
+    def _calibration_overlay(self) -> tuple:
+        """Integer corner points, boundary polygon and pocket rectangles for drawing"""
+        # Calibration data is replaced, never edited, so identity tells when to rebuild
+        if self._overlay_source is not self.calibration_data:
+            # Cached or recovered calibrations carry only Points, so convert here
+            corners = self._corner_array(self.calibration_data.table_corners or [])
+            corner_polygon = corners.astype(np.int32)
+            self._overlay = (
+                [tuple(p) for p in corner_polygon.tolist()],
+                corner_polygon,
+                [((p.x1, p.y1), (p.x2, p.y2)) for p in self.calibration_data.pocket_regions]
+            )
+            self._overlay_source = self.calibration_data
+        return self._overlay
+    
     def _load_cached_calibration(self) -> bool:
         """Load calibration data from cache if available"""
         try:
+            self.flush_pending_saves()
             cached_data = self.persistence_manager.load_calibration_data()
             if cached_data and cached_data.is_calibrated():
                 self.calibration_data = cached_data
@@ -412,24 +808,49 @@ class TableCalibrationEngine(ICalibrationEngine):
             logger.warning(f"Failed to load cached calibration: {e}")
             return False
     
+    @staticmethod
+    def _region_hash(frame: np.ndarray, roi: Tuple[int, int, int, int]) -> Optional[int]:
+        """64-bit average hash of frame[roi], or None if the region is empty"""
+        x1, y1, x2, y2 = roi
+        region = frame[y1:y2, x1:x2]
+        if region.size == 0:
+            return None
+        
+        small = cv2.resize(region, (8, 8), interpolation=cv2.INTER_AREA)
+        if small.ndim == 3:
+            small = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+        bits = (small > small.mean()).ravel()
+        return int.from_bytes(np.packbits(bits).tobytes(), 'big')
+    
     def _detect_camera_angle_change(self, frame: np.ndarray) -> bool:
         """Detect if camera angle has changed significantly"""
-        if not self.previous_corners or len(self.previous_corners) != 4:
+        if self._corners_np is None or len(self._corners_np) != 4:
             return False
         
         try:
-            # Detect current corners
-            current_corners = self.detect_table_corners(frame)
-            if len(current_corners) != 4:
-                return False
+            # A table region that still looks like the calibration frame has not moved
+            if self._roi_hash is not None and self._last_roi is not None:
+                current_hash = self._region_hash(frame, self._last_roi)
+                if (current_hash is not None and
+                        bin(current_hash ^ self._roi_hash).count('1') < self.ROI_HASH_DISTANCE):
+                    return False
+            
+            # Detect current corners, first within the last table region only
+            current_corners = []
+            if self._last_roi is not None:
+                x1, y1, x2, y2 = self._last_roi
+                current_corners = self.detect_table_corners(frame[y1:y2, x1:x2])
+            if len(current_corners) == 4:
+                current = self._corner_array(current_corners) + np.array([x1, y1], dtype=np.float32)
+            else:
+                # The table may have moved out of the region; search the full frame
+                current_corners = self.detect_table_corners(frame)
+                if len(current_corners) != 4:
+                    return False
+                current = self._corner_array(current_corners)
             
             # Calculate average displacement
-            total_displacement = 0.0
-            for prev_corner, curr_corner in zip(self.previous_corners, current_corners):
-                displacement = prev_corner.distance_to(curr_corner)
-                total_displacement += displacement
-            
-            avg_displacement = total_displacement / 4
+            avg_displacement = float(np.linalg.norm(current - self._corners_np, axis=1).mean())
             
             if avg_displacement > self.corner_change_threshold:
                 logger.info(f"Camera angle change detected: avg displacement {avg_displacement:.1f}px")
@@ -483,4 +904,6 @@ class TableCalibrationEngine(ICalibrationEngine):
     
     def clear_calibration_cache(self) -> bool:
         """Clear all cached calibration data"""
+        # A save still in flight would otherwise recreate the cache after clearing
+        self.flush_pending_saves()
         return self.persistence_manager.clear_cache()
\ No newline at end of file
@@ -3,10 +3,13 @@
 Configuration loading and saving utilities
 """
 
+import copy
 import json
 import logging
 import os
-from typing import Dict, Any, Optional, Union
+import shutil
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple, Union
 from pathlib import Path
 
 # Optional YAML import
@@ -16,40 +19,84 @@ try:
 except ImportError:
     HAS_YAML = False
 
+# Optional orjson import for faster config parsing
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 logger = logging.getLogger(__name__)
 
+if HAS_ORJSON:
+    def _json_dumps(obj: Any) -> bytes:
+        """Serialize config to indented JSON bytes, stringifying unknown types"""
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    _json_loads = orjson.loads
+else:
+    def _json_dumps(obj: Any) -> bytes:
+        """Serialize config to indented JSON bytes, stringifying unknown types"""
+        return json.dumps(obj, indent=2, default=str).encode('utf-8')
+    
+    _json_loads = json.loads
+
+# libyaml-backed loader when PyYAML was built with it
+_YamlSafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader) if HAS_YAML else None
+
 class ConfigLoader:
     """Configuration file loader supporting multiple formats"""
     
+    # Parsed configs kept, keyed by file identity and modification stamp
+    CACHE_SIZE = 32
+    
     def __init__(self):
         self.supported_formats = {'.json'}
         if HAS_YAML:
             self.supported_formats.update({'.yaml', '.yml'})
+        self._cache: "OrderedDict[Tuple[str, int, int, int], Dict[str, Any]]" = OrderedDict()
     
-    def load_config(self, config_path: Union[str, Path]) -> Dict[str, Any]:
-        """Load configuration from file"""
+    def load_config(self, config_path: Union[str, Path],
+                    stat_result: Optional[os.stat_result] = None) -> Dict[str, Any]:
+        """Load configuration from file; stat_result, if given, saves stat-ing it again"""
         config_path = Path(config_path)
         
-        if not config_path.exists():
-            raise FileNotFoundError(f"Configuration file not found: {config_path}")
+        if stat_result is None:
+            try:
+                stat_result = config_path.stat()
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Configuration file not found: {config_path}") from None
         
         if config_path.suffix not in self.supported_formats:
             raise ValueError(f"Unsupported config format: {config_path.suffix}. "
                            f"Supported formats: {self.supported_formats}")
         
+        # Unchanged files are served from the cache; callers get their own copy to mutate
+        key = (str(config_path.resolve()), stat_result.st_mtime_ns, stat_result.st_size, stat_result.st_ino)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            logger.debug(f"Configuration reused from cache: {config_path}")
+            return copy.deepcopy(cached)
+        
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
+            with open(config_path, 'rb') as f:
                 if config_path.suffix == '.json':
-                    config = json.load(f)
+                    config = _json_loads(f.read())
                 elif config_path.suffix in {'.yaml', '.yml'}:
                     if not HAS_YAML:
                         raise ValueError("YAML support not available - install PyYAML")
-                    config = yaml.safe_load(f)
+                    config = yaml.load(f, Loader=_YamlSafeLoader)
                 else:
                     raise ValueError(f"Unsupported format: {config_path.suffix}")
             
+            self._cache[key] = config
+            if len(self._cache) > self.CACHE_SIZE:
+                self._cache.popitem(last=False)
+            
             logger.info(f"Configuration loaded from: {config_path}")
-            return config
+            return copy.deepcopy(config)
             
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in config file: {e}")
@@ -78,15 +125,16 @@ class ConfigLoader:
         config_path.parent.mkdir(parents=True, exist_ok=True)
         
         try:
-            with open(config_path, 'w', encoding='utf-8') as f:
-                if format == '.json':
-                    json.dump(config, f, indent=2, default=str)
-                elif format in {'.yaml', '.yml'}:
-                    if not HAS_YAML:
-                        raise ValueError("YAML support not available - install PyYAML")
+            if format == '.json':
+                with open(config_path, 'wb') as f:
+                    f.write(_json_dumps(config))
+            elif format in {'.yaml', '.yml'}:
+                if not HAS_YAML:
+                    raise ValueError("YAML support not available - install PyYAML")
+                with open(config_path, 'w', encoding='utf-8') as f:
                     yaml.dump(config, f, default_flow_style=False, indent=2)
-                else:
-                    raise ValueError(f"Unsupported format: {format}")
+            else:
+                raise ValueError(f"Unsupported format: {format}")
             
             logger.info(f"Configuration saved to: {config_path}")
             
@@ -169,8 +217,8 @@ class ConfigLoader:
         """Create JSON configuration template"""
         config_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(config_path, 'w', encoding='utf-8') as f:
-            json.dump(schema_defaults, f, indent=2, default=str)
+        with open(config_path, 'wb') as f:
+            f.write(_json_dumps(schema_defaults))
         
         logger.info(f"Configuration template created: {config_path}")
     
@@ -202,7 +250,6 @@ class ConfigLoader:
             backup_path = config_path.with_name(f"{config_path.stem}_backup{config_path.suffix}")
         
         # Copy file
-        import shutil
         shutil.copy2(config_path, backup_path)
         
         logger.info(f"Configuration backed up to: {backup_path}")
@@ -218,12 +265,17 @@ class ConfigLoader:
         if config_path.suffix not in self.supported_formats:
             return False
         
+        # Only successfully parsed files are cached, so an unchanged cached file is valid
+        stat = config_path.stat()
+        if (str(config_path.resolve()), stat.st_mtime_ns, stat.st_size, stat.st_ino) in self._cache:
+            return True
+        
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
+            with open(config_path, 'rb') as f:
                 if config_path.suffix == '.json':
-                    json.load(f)
+                    _json_loads(f.read())
                 elif config_path.suffix in {'.yaml', '.yml'}:
-                    yaml.safe_load(f)
+                    yaml.load(f, Loader=_YamlSafeLoader)
             return True
         except:
             return False
\ No newline at end of file
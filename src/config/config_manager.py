@@ -3,20 +3,76 @@
 Main configuration manager for the snooker detection system
 """
 
+import hashlib
 import logging
 import os
-from typing import Dict, Any, Optional, Union, List
+from typing import Dict, Any, List, Optional, Union, Mapping, Tuple
 from pathlib import Path
 import threading
 import time
+from contextlib import contextmanager
+from types import MappingProxyType
 
-from .config_schema import ConfigSchema
+from .config_schema import ConfigSchema, _clone_config, _split_key
 from .config_validator import ConfigValidator, ValidationResult
 from .config_loader import ConfigLoader
 from ..core import SystemConfig, DetectionConfig, TrackingConfig, CalibrationConfig
 
+# Optional file-system event support for auto-reload
+try:
+    from watchdog.observers import Observer
+    from watchdog.observers.polling import PollingObserver
+    from watchdog.events import FileSystemEventHandler
+    HAS_WATCHDOG = True
+except ImportError:
+    HAS_WATCHDOG = False
+
 logger = logging.getLogger(__name__)
 
+def _freeze(obj: Any) -> Any:
+    """Read-only snapshot of a config value: dicts become mapping proxies, lists tuples"""
+    if isinstance(obj, dict):
+        return MappingProxyType({key: _freeze(value) for key, value in obj.items()})
+    if isinstance(obj, (list, tuple)):
+        return tuple(_freeze(value) for value in obj)
+    return obj
+
+# Marks a key absent from the flat index (None is a valid config value)
+_MISSING = object()
+
+def _flatten(config: Dict[str, Any], prefix: str = "", out: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Index every non-dict value of a nested config by its dotted key"""
+    if out is None:
+        out = {}
+    for key, value in config.items():
+        dotted = f"{prefix}{key}"
+        if isinstance(value, dict):
+            _flatten(value, dotted + ".", out)
+        else:
+            out[dotted] = value
+    return out
+
+if HAS_WATCHDOG:
+    class _ConfigFileEventHandler(FileSystemEventHandler):
+        """Forwards file-system events for the watched config file"""
+        
+        def __init__(self, manager: 'ConfigManager'):
+            super().__init__()
+            self.manager = manager
+        
+        def on_modified(self, event) -> None:
+            if not event.is_directory:
+                self.manager._on_config_file_event(event.src_path)
+        
+        def on_created(self, event) -> None:
+            if not event.is_directory:
+                self.manager._on_config_file_event(event.src_path)
+        
+        def on_moved(self, event) -> None:
+            # Editors that save via rename-into-place show up as moves
+            if not event.is_directory:
+                self.manager._on_config_file_event(event.dest_path)
+
 class ConfigManager:
     """Centralized configuration management system"""
     
@@ -26,15 +82,28 @@ class ConfigManager:
         self.validator = ConfigValidator(self.schema)
         self.loader = ConfigLoader()
         
-        # Configuration state
-        self._config: Dict[str, Any] = {}
-        self._config_lock = threading.RLock()
+        # Configuration state: (version, config dict, read-only view, dotted-key index
+        # of leaf values), replaced whole by writers and never mutated once published,
+        # so readers need no lock
+        self._snapshot: Tuple[int, Dict[str, Any], Mapping[str, Any], Dict[str, Any]] = (
+            0, {}, MappingProxyType({}), {})
+        self._write_lock = threading.Lock()
         self._last_modified = 0
+        # (mtime_ns, size) and SHA-256 of the config file as last loaded or saved
+        self._file_signature: Optional[Tuple[int, int]] = None
+        self._file_digest: Optional[str] = None
+        # (resolved path, format, config version) of the last successful save
+        self._last_save: Optional[Tuple[Path, Optional[str], int]] = None
         self._auto_reload = False
         self._reload_thread = None
+        self._config_observer = None
         
         # Change callbacks
-        self._change_callbacks: List[callable] = []
+        # Replaced rather than mutated, so a notification round iterates a stable tuple
+        self._change_callbacks: Tuple[callable, ...] = ()
+        # Nesting depth of batch_updates and whether a change arrived meanwhile
+        self._notify_suspended = 0
+        self._notify_pending = False
         
         # Load initial configuration
         self._load_initial_config()
@@ -46,19 +115,28 @@ class ConfigManager:
                 self.load_from_file(self.config_file)
             else:
                 # Use default configuration
-                self._config = self.schema.get_default_config()
+                with self._write_lock:
+                    self._publish(self.schema.get_default_config())
                 logger.info("Using default configuration")
         except Exception as e:
             logger.error(f"Failed to load initial config: {e}")
-            self._config = self.schema.get_default_config()
+            with self._write_lock:
+                self._publish(self.schema.get_default_config())
     
-    def load_from_file(self, config_path: Union[str, Path]) -> ValidationResult:
-        """Load configuration from file with validation"""
+    def load_from_file(self, config_path: Union[str, Path],
+                       stat_result: Optional[os.stat_result] = None) -> ValidationResult:
+        """Load configuration from file with validation
+        
+        Callers that have just stat-ed the file can pass ``stat_result`` so it
+        is not stat-ed again.
+        """
         config_path = Path(config_path)
         
         try:
             # Load raw configuration
-            raw_config = self.loader.load_config(config_path)
+            raw_config = self.loader.load_config(config_path, stat_result)
+            if stat_result is None:
+                stat_result = config_path.stat()
             
             # Validate configuration
             validation_result = self.validator.validate_config(raw_config, auto_fix=True)
@@ -71,10 +149,11 @@ class ConfigManager:
             
             # Update configuration if valid or auto-fixed
             if validation_result.is_valid:
-                with self._config_lock:
-                    self._config = fixed_config
+                with self._write_lock:
+                    self._publish(fixed_config)
                     self.config_file = config_path
-                    self._last_modified = config_path.stat().st_mtime
+                    self._last_modified = stat_result.st_mtime
+                    self._remember_file_state(config_path, stat_result)
                 
                 # Notify callbacks
                 self._notify_change_callbacks()
@@ -104,17 +183,28 @@ class ConfigManager:
             return False
         
         try:
+            version, config, _, _ = self._snapshot
+            save_key = (target_path.resolve(), format, version)
+            
+            # Same config already written there and the file untouched since: nothing to do
+            if (save_key == self._last_save and self._file_signature is not None and
+                    self._file_signature == self._stat_signature(target_path)):
+                logger.debug(f"Configuration unchanged since last save: {target_path}")
+                return True
+            
             # Create backup if requested
             if create_backup and target_path.exists():
                 self.loader.backup_config(target_path)
             
             # Save configuration
-            with self._config_lock:
-                self.loader.save_config(self._config, target_path, format)
+            self.loader.save_config(config, target_path, format)
             
             # Update file reference
+            stat_result = target_path.stat()
             self.config_file = target_path
-            self._last_modified = target_path.stat().st_mtime
+            self._last_modified = stat_result.st_mtime
+            self._remember_file_state(target_path, stat_result)
+            self._last_save = save_key
             
             return True
             
@@ -122,15 +212,29 @@ class ConfigManager:
             logger.error(f"Failed to save configuration: {e}")
             return False
     
-    def get_config(self) -> Dict[str, Any]:
-        """Get current configuration (thread-safe copy)"""
-        with self._config_lock:
-            return self._deep_copy(self._config)
+    def get_config(self, mutable: bool = False) -> Mapping[str, Any]:
+        """Get current configuration as a shared read-only view (a deep copy when mutable)
+        
+        In the read-only view sections are mapping proxies and list values are
+        tuples (e.g. ``detection.input_size``); pass ``mutable=True`` for plain
+        dicts and lists.
+        """
+        _, config, frozen_config, _ = self._snapshot
+        return self._deep_copy(config) if mutable else frozen_config
     
     def get_value(self, key: str, default: Any = None) -> Any:
-        """Get configuration value using dot notation"""
-        with self._config_lock:
-            return self._get_nested_value(self._config, key, default)
+        """Get configuration value using dot notation
+        
+        Sections are returned as read-only views, like ``get_config()``; list
+        leaves are copied so callers cannot edit the published snapshot.
+        """
+        # Leaf values come from the snapshot's flat index; sections fall back to a
+        # walk of the read-only view
+        _, _, frozen_config, flat_values = self._snapshot
+        value = flat_values.get(key, _MISSING)
+        if value is not _MISSING:
+            return self._deep_copy(value) if isinstance(value, list) else value
+        return self._get_nested_value(frozen_config, key, default)
     
     def set_value(self, key: str, value: Any, validate: bool = True) -> bool:
         """Set configuration value using dot notation"""
@@ -141,16 +245,20 @@ class ConfigManager:
                 logger.error(f"Invalid value for '{key}': {validation_result.errors[0]}")
                 return False
         
-        with self._config_lock:
-            old_value = self._get_nested_value(self._config, key)
-            self._set_nested_value(self._config, key, value)
-            
-            # Notify callbacks if value changed
-            if old_value != value:
-                self._notify_change_callbacks()
-            
-            logger.debug(f"Configuration updated: {key} = {value}")
-            return True
+        with self._write_lock:
+            # Copy on write; one traversal both reads the old value and stores the new one
+            config = self._deep_copy(self._snapshot[1])
+            old_value = self._set_nested_value(config, key, value)
+            changed = old_value != value
+            if changed:
+                self._publish(config)
+        
+        # Notify callbacks if value changed
+        if changed:
+            self._notify_change_callbacks()
+        
+        logger.debug(f"Configuration updated: {key} = {value}")
+        return True
     
     def update_config(self, updates: Dict[str, Any], validate: bool = True) -> ValidationResult:
         """Update multiple configuration values"""
@@ -160,63 +268,92 @@ class ConfigManager:
             if not validation_result.is_valid:
                 return validation_result
         
-        with self._config_lock:
-            # Apply updates
+        with self._write_lock:
+            # Apply updates to a copy and publish them together
+            config = self._deep_copy(self._snapshot[1])
             for key, value in updates.items():
-                self._set_nested_value(self._config, key, value)
-            
-            # Notify callbacks
-            self._notify_change_callbacks()
+                self._set_nested_value(config, key, value)
+            self._publish(config)
+        
+        # Notify callbacks
+        self._notify_change_callbacks()
         
         logger.info(f"Configuration updated with {len(updates)} changes")
         
-        result = ValidationResult()
-        return result
+        # The passing validation result already says so; otherwise a fresh empty one
+        return validation_result if validate else ValidationResult()
     
     def reset_to_defaults(self) -> None:
         """Reset configuration to default values"""
-        with self._config_lock:
-            self._config = self.schema.get_default_config()
-            self._notify_change_callbacks()
+        with self._write_lock:
+            self._publish(self.schema.get_default_config())
+        self._notify_change_callbacks()
         
         logger.info("Configuration reset to defaults")
     
     def validate_current_config(self) -> ValidationResult:
         """Validate current configuration"""
-        with self._config_lock:
-            return self.validator.validate_config(self._config, auto_fix=False)
+        return self.validator.validate_config(self._snapshot[1], auto_fix=False)
     
     def get_system_config(self) -> SystemConfig:
-        """Convert to SystemConfig object"""
-        with self._config_lock:
-            config_dict = self._config
-            
-            return SystemConfig(
-                detection=DetectionConfig(
-                    model_path=config_dict.get('detection', {}).get('model_path', 'models/best.pt'),
-                    confidence_threshold=config_dict.get('detection', {}).get('confidence_threshold', 0.2),
-                    nms_threshold=config_dict.get('detection', {}).get('nms_threshold', 0.5),
-                    input_size=tuple(config_dict.get('detection', {}).get('input_size', [640, 640])),
-                    device=config_dict.get('detection', {}).get('device', 'cpu')
-                ),
-                tracking=TrackingConfig(
-                    max_disappeared_frames=config_dict.get('tracking', {}).get('max_disappeared_frames', 10),
-                    max_tracking_distance=config_dict.get('tracking', {}).get('max_tracking_distance', 50.0),
-                    kalman_process_noise=config_dict.get('tracking', {}).get('kalman_process_noise', 0.1),
-                    kalman_measurement_noise=config_dict.get('tracking', {}).get('kalman_measurement_noise', 0.1),
-                    trajectory_smoothing=config_dict.get('tracking', {}).get('trajectory_smoothing', True)
-                ),
-                calibration=CalibrationConfig(
-                    table_length=config_dict.get('calibration', {}).get('table_length', 3.569),
-                    table_width=config_dict.get('calibration', {}).get('table_width', 1.778),
-                    auto_recalibrate=config_dict.get('calibration', {}).get('auto_recalibrate', True),
-                    calibration_interval=config_dict.get('calibration', {}).get('calibration_interval', 100),
-                    corner_detection_threshold=config_dict.get('calibration', {}).get('corner_detection_threshold', 0.1)
-                ),
-                debug_mode=config_dict.get('system', {}).get('debug_mode', False),
-                save_debug_frames=config_dict.get('system', {}).get('save_debug_frames', False),
-                output_directory=config_dict.get('system', {}).get('output_directory', 'output')
-            )
+        """Convert to SystemConfig object
+        
+        Built fresh from the current snapshot on each call (a few microseconds,
+        cheaper than copying a cached instance), so callers may modify it.
+        """
+        return self._build_system_config(self._snapshot[1])
+    
+    @property
+    def version(self) -> int:
+        """Number of the published configuration; increases with every change"""
+        return self._snapshot[0]
+    
+    def _publish(self, config: Dict[str, Any]) -> None:
+        """Make config the current configuration; call with the write lock held
+        
+        config must not be mutated afterwards. The new snapshot, with its
+        read-only view and dotted-key index, is published with a single
+        attribute assignment.
+        """
+        self._snapshot = (self._snapshot[0] + 1, config, _freeze(config), _flatten(config))
+    
+    @staticmethod
+    def _build_system_config(config_dict: Dict[str, Any]) -> SystemConfig:
+        """Build a SystemConfig from a configuration dictionary"""
+        # Fetch each section once
+        detection_section = config_dict.get('detection') or {}
+        tracking_section = config_dict.get('tracking') or {}
+        calibration_section = config_dict.get('calibration') or {}
+        system_section = config_dict.get('system') or {}
+        
+        return SystemConfig(
+            detection=DetectionConfig(
+                model_path=detection_section.get('model_path', 'models/best.pt'),
+                confidence_threshold=detection_section.get('confidence_threshold', 0.2),
+                nms_threshold=detection_section.get('nms_threshold', 0.5),
+                input_size=tuple(detection_section.get('input_size', [640, 640])),
+                device=detection_section.get('device', 'cpu')
+            ),
+            tracking=TrackingConfig(
+                max_disappeared_frames=tracking_section.get('max_disappeared_frames', 10),
+                max_tracking_distance=tracking_section.get('max_tracking_distance', 50.0),
+                kalman_process_noise=tracking_section.get('kalman_process_noise', 0.1),
+                kalman_measurement_noise=tracking_section.get('kalman_measurement_noise', 0.1),
+                trajectory_smoothing=tracking_section.get('trajectory_smoothing', True)
+            ),
+            calibration=CalibrationConfig(
+                table_length=calibration_section.get('table_length', 3.569),
+                table_width=calibration_section.get('table_width', 1.778),
+                auto_recalibrate=calibration_section.get('auto_recalibrate', True),
+                calibration_interval=calibration_section.get('calibration_interval', 100),
+                corner_detection_threshold=calibration_section.get('corner_detection_threshold', 0.1),
+                green_dominance_ratio=calibration_section.get('green_dominance_ratio', 1.15),
+                pre_blur=calibration_section.get('pre_blur', False)
+            ),
+            debug_mode=system_section.get('debug_mode', False),
+            save_debug_frames=system_section.get('save_debug_frames', False),
+            output_directory=system_section.get('output_directory', 'output')
+        )
     
     def create_config_template(self, output_path: Union[str, Path],
                              format: str = 'yaml') -> None:
@@ -224,15 +361,28 @@ class ConfigManager:
         defaults = self.schema.get_default_config()
         self.loader.create_config_template(output_path, defaults, format)
     
-    def enable_auto_reload(self, check_interval: float = 1.0) -> None:
-        """Enable automatic configuration reloading"""
+    def enable_auto_reload(self, check_interval: float = 1.0, debounce: float = 0.25) -> None:
+        """Enable automatic configuration reloading
+        
+        Uses watchdog file-system events when available, so changes are picked
+        up immediately without periodic wakeups. ``check_interval`` only applies
+        to the polling fallbacks; the polling thread also waits for ``debounce``
+        seconds without further changes before reloading.
+        """
         if self._auto_reload:
             return
         
         self._auto_reload = True
+        
+        if HAS_WATCHDOG and self.config_file:
+            self._config_observer = self._start_config_observer(check_interval)
+            if self._config_observer:
+                logger.info("Auto-reload enabled (file-system events)")
+                return
+        
         self._reload_thread = threading.Thread(
             target=self._auto_reload_worker,
-            args=(check_interval,),
+            args=(check_interval, debounce),
             daemon=True
         )
         self._reload_thread.start()
@@ -242,41 +392,179 @@ class ConfigManager:
     def disable_auto_reload(self) -> None:
         """Disable automatic configuration reloading"""
         self._auto_reload = False
+        
+        if self._config_observer:
+            self._config_observer.stop()
+            self._config_observer.join(timeout=2.0)
+            self._config_observer = None
+        
         if self._reload_thread:
             self._reload_thread.join(timeout=2.0)
+            self._reload_thread = None
         
         logger.info("Auto-reload disabled")
     
-    def _auto_reload_worker(self, check_interval: float) -> None:
-        """Auto-reload worker thread"""
+    def _start_config_observer(self, check_interval: float):
+        """Start a watchdog observer on the config file's directory"""
+        handler = _ConfigFileEventHandler(self)
+        watch_dir = str(self.config_file.resolve().parent)
+        
+        # Native observer (inotify/FSEvents/ReadDirectoryChangesW) first, then
+        # watchdog's polling observer, e.g. when inotify watches are exhausted
+        for observer_factory in (Observer, lambda: PollingObserver(timeout=check_interval)):
+            observer = observer_factory()
+            try:
+                observer.schedule(handler, watch_dir, recursive=False)
+                observer.daemon = True
+                observer.start()
+                return observer
+            except Exception as e:
+                logger.warning(f"Config file observer unavailable ({type(observer).__name__}): {e}")
+        
+        return None
+    
+    def _on_config_file_event(self, path: str) -> None:
+        """Reload configuration when the watched file changes"""
+        try:
+            if not self._auto_reload or not self.config_file:
+                return
+            if Path(path).resolve() != self.config_file.resolve():
+                return
+            
+            # One save can emit several events; only reload on a newer mtime
+            stat_result = self.config_file.stat()
+            if stat_result.st_mtime > self._last_modified:
+                logger.info("Configuration file changed, reloading...")
+                self.load_from_file(self.config_file, stat_result)
+                
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.error(f"Auto-reload error: {e}")
+    
+    def _auto_reload_worker(self, check_interval: float, debounce: float = 0.25) -> None:
+        """Auto-reload worker thread; reloads once the file has been quiet for debounce seconds"""
+        pending_signature = None
+        pending_since = 0.0
         while self._auto_reload:
             try:
-                if self.config_file and self.config_file.exists():
-                    current_mtime = self.config_file.stat().st_mtime
-                    if current_mtime > self._last_modified:
+                # One stat per tick, shared by the change check and the reload
+                stat_result = None
+                if self.config_file:
+                    try:
+                        stat_result = self.config_file.stat()
+                    except FileNotFoundError:
+                        pass
+                signature = (stat_result.st_mtime_ns, stat_result.st_size) if stat_result else None
+                
+                if signature is None or signature == self._file_signature:
+                    pending_signature = None
+                elif signature != pending_signature:
+                    # Still being written; restart the quiet period
+                    pending_signature = signature
+                    pending_since = time.monotonic()
+                elif time.monotonic() - pending_since >= debounce:
+                    pending_signature = None
+                    if self._file_content_changed(signature):
                         logger.info("Configuration file changed, reloading...")
-                        self.load_from_file(self.config_file)
+                        self.load_from_file(self.config_file, stat_result)
                 
-                time.sleep(check_interval)
+                time.sleep(min(check_interval, debounce) if pending_signature else check_interval)
                 
             except Exception as e:
                 logger.error(f"Auto-reload error: {e}")
                 time.sleep(check_interval)
     
+    def _remember_file_state(self, path: Path, stat_result: Optional[os.stat_result] = None) -> None:
+        """Record the signature and digest of the file just loaded or saved"""
+        try:
+            if stat_result is None:
+                stat_result = path.stat()
+            self._file_signature = (stat_result.st_mtime_ns, stat_result.st_size)
+            self._file_digest = self._file_sha256(path)
+        except OSError as e:
+            logger.debug(f"Could not record config file state: {e}")
+            self._file_signature = None
+            self._file_digest = None
+    
+    def _file_content_changed(self, signature: Tuple[int, int]) -> bool:
+        """Whether the config file differs from the recorded state, given its new signature
+        
+        A size change is always a change; when only the mtime moved (a touch,
+        or an identical rewrite) the contents are hashed to decide.
+        """
+        if (self._file_signature is None or self._file_digest is None or
+                signature[1] != self._file_signature[1]):
+            return True
+        
+        if self._file_sha256(self.config_file) != self._file_digest:
+            return True
+        
+        # Same bytes: adopt the new signature so the file is not rechecked
+        self._file_signature = signature
+        return False
+    
+    @staticmethod
+    def _stat_signature(path: Path) -> Optional[Tuple[int, int]]:
+        """(mtime_ns, size) of path, or None if it does not exist"""
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+    
+    @staticmethod
+    def _file_sha256(path: Path) -> str:
+        """SHA-256 hex digest of a file's contents"""
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    
     def add_change_callback(self, callback: callable) -> None:
         """Add callback for configuration changes"""
-        self._change_callbacks.append(callback)
+        with self._write_lock:
+            self._change_callbacks = self._change_callbacks + (callback,)
     
     def remove_change_callback(self, callback: callable) -> None:
         """Remove configuration change callback"""
-        if callback in self._change_callbacks:
-            self._change_callbacks.remove(callback)
+        with self._write_lock:
+            if callback in self._change_callbacks:
+                callbacks = list(self._change_callbacks)
+                callbacks.remove(callback)
+                self._change_callbacks = tuple(callbacks)
+    
+    @contextmanager
+    def batch_updates(self):
+        """Hold change callbacks inside the block and notify once at the end if anything changed
+        
+        Suspension is manager-wide, so changes from other threads made while
+        the block runs are folded into the same notification.
+        """
+        with self._write_lock:
+            self._notify_suspended += 1
+        try:
+            yield self
+        finally:
+            with self._write_lock:
+                self._notify_suspended -= 1
+                notify = self._notify_suspended == 0 and self._notify_pending
+                if notify:
+                    self._notify_pending = False
+            if notify:
+                self._notify_change_callbacks()
     
     def _notify_change_callbacks(self) -> None:
-        """Notify all change callbacks"""
+        """Notify all change callbacks (deferred while inside batch_updates)"""
+        with self._write_lock:
+            if self._notify_suspended:
+                self._notify_pending = True
+                return
+        
+        # One snapshot and one subscriber list for the whole round; callbacks
+        # receive the read-only view
+        config = self.get_config()
         for callback in self._change_callbacks:
             try:
-                callback(self.get_config())
+                callback(config)
             except Exception as e:
                 logger.error(f"Configuration change callback error: {e}")
     
@@ -287,17 +575,15 @@ class ConfigManager:
     def export_config_documentation(self, output_path: Union[str, Path],
                                   format: str = 'markdown') -> None:
         """Export configuration documentation"""
-        field_info = self.get_field_documentation()
-        
         if format == 'markdown':
-            self._export_markdown_docs(output_path, field_info)
+            self._export_markdown_docs(output_path, self.validator.get_field_info_by_section())
         elif format == 'json':
-            self.loader.save_config(field_info, output_path, 'json')
+            self.loader.save_config(self.get_field_documentation(), output_path, 'json')
         else:
             raise ValueError(f"Unsupported documentation format: {format}")
     
     def _export_markdown_docs(self, output_path: Union[str, Path],
-                            field_info: Dict[str, Dict[str, Any]]) -> None:
+                            sections: Mapping[str, List[Tuple[str, Dict[str, Any]]]]) -> None:
         """Export documentation as markdown"""
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -305,14 +591,6 @@ class ConfigManager:
         with open(output_path, 'w', encoding='utf-8') as f:
             f.write("# Snooker Detection System Configuration\n\n")
             
-            # Group by section
-            sections = {}
-            for field_name, info in field_info.items():
-                section = field_name.split('.')[0]
-                if section not in sections:
-                    sections[section] = []
-                sections[section].append((field_name, info))
-            
             for section_name, fields in sections.items():
                 f.write(f"## {section_name.title()} Configuration\n\n")
                 
@@ -338,12 +616,11 @@ class ConfigManager:
     
     def _deep_copy(self, obj: Any) -> Any:
         """Deep copy object"""
-        import copy
-        return copy.deepcopy(obj)
+        return _clone_config(obj)
     
     def _get_nested_value(self, config: Dict[str, Any], key: str, default: Any = None) -> Any:
         """Get nested dictionary value using dot notation"""
-        keys = key.split('.')
+        keys = _split_key(key)
         current = config
         
         try:
@@ -353,9 +630,9 @@ class ConfigManager:
         except (KeyError, TypeError):
             return default
     
-    def _set_nested_value(self, config: Dict[str, Any], key: str, value: Any) -> None:
-        """Set nested dictionary value using dot notation"""
-        keys = key.split('.')
+    def _set_nested_value(self, config: Dict[str, Any], key: str, value: Any) -> Any:
+        """Set nested dictionary value using dot notation, returning the previous value (or None)"""
+        keys = _split_key(key)
         current = config
         
         for k in keys[:-1]:
@@ -363,7 +640,9 @@ class ConfigManager:
                 current[k] = {}
             current = current[k]
         
+        old_value = current.get(keys[-1])
         current[keys[-1]] = value
+        return old_value
     
     def _apply_fixes(self, config: Dict[str, Any], fixes: Dict[str, Any]) -> Dict[str, Any]:
         """Apply validation fixes to configuration"""
@@ -3,9 +3,51 @@
 Configuration schema definitions and validation rules
 """
 
-from typing import Dict, Any, List, Optional, Union
+import copy
+import os
+import stat
+import time
+from typing import Dict, Any, List, Optional, Tuple, Union
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
+
+@lru_cache(maxsize=512)
+def _split_key(key: str) -> Tuple[str, ...]:
+    """Split a dot-notation key into its parts (cached; keys repeat constantly)"""
+    return tuple(key.split('.'))
+
+# Seconds a cached path lookup stays valid during validation
+_PATH_CACHE_TTL = 10.0
+
+@lru_cache(maxsize=64)
+def _path_is_dir(path: str, time_bucket: int) -> Optional[bool]:
+    """One stat per path and TTL time bucket: None if missing, else whether it is a directory"""
+    try:
+        return stat.S_ISDIR(os.stat(path).st_mode)
+    except OSError:
+        return None
+
+def _path_is_dir_cached(path: str) -> Optional[bool]:
+    """_path_is_dir, re-checked at most once per _PATH_CACHE_TTL seconds"""
+    return _path_is_dir(path, int(time.monotonic() // _PATH_CACHE_TTL))
+
+# Scalar config value types that are shared rather than copied
+_IMMUTABLE_TYPES = (str, int, float, bool, type(None))
+
+def _clone_config(obj: Any) -> Any:
+    """Deep copy a config value; values are JSON-like, so containers are cloned by type"""
+    obj_type = type(obj)
+    if obj_type is dict:
+        return {key: _clone_config(value) for key, value in obj.items()}
+    if obj_type is list:
+        return [_clone_config(value) for value in obj]
+    if obj_type in _IMMUTABLE_TYPES:
+        return obj
+    if obj_type is tuple:
+        return tuple(_clone_config(value) for value in obj)
+    # Anything unexpected still gets a full copy
+    return copy.deepcopy(obj)
 
 class ConfigType(Enum):
     """Configuration value types"""
@@ -18,6 +60,18 @@ class ConfigType(Enum):
     PATH = "path"
     ENUM = "enum"
 
+# Accepted Python types and error wording per config type; ENUM has no type check
+_TYPE_CHECKS = {
+    ConfigType.STRING: (str, "must be a string"),
+    ConfigType.INTEGER: (int, "must be an integer"),
+    ConfigType.FLOAT: ((int, float), "must be a number"),
+    ConfigType.BOOLEAN: (bool, "must be a boolean"),
+    ConfigType.LIST: (list, "must be a list"),
+    ConfigType.DICT: (dict, "must be a dictionary"),
+    ConfigType.PATH: (str, "must be a valid path string"),
+}
+_NUMERIC_TYPES = frozenset((ConfigType.INTEGER, ConfigType.FLOAT))
+
 @dataclass
 class ConfigField:
     """Configuration field definition"""
@@ -41,23 +95,12 @@ class ConfigField:
             return True, ""
         
         # Type validation
-        if self.type == ConfigType.STRING and not isinstance(value, str):
-            return False, f"Field '{self.name}' must be a string"
-        elif self.type == ConfigType.INTEGER and not isinstance(value, int):
-            return False, f"Field '{self.name}' must be an integer"
-        elif self.type == ConfigType.FLOAT and not isinstance(value, (int, float)):
-            return False, f"Field '{self.name}' must be a number"
-        elif self.type == ConfigType.BOOLEAN and not isinstance(value, bool):
-            return False, f"Field '{self.name}' must be a boolean"
-        elif self.type == ConfigType.LIST and not isinstance(value, list):
-            return False, f"Field '{self.name}' must be a list"
-        elif self.type == ConfigType.DICT and not isinstance(value, dict):
-            return False, f"Field '{self.name}' must be a dictionary"
-        elif self.type == ConfigType.PATH and not isinstance(value, str):
-            return False, f"Field '{self.name}' must be a valid path string"
+        type_check = _TYPE_CHECKS.get(self.type)
+        if type_check is not None and not isinstance(value, type_check[0]):
+            return False, f"Field '{self.name}' {type_check[1]}"
         
         # Range validation
-        if self.type in [ConfigType.INTEGER, ConfigType.FLOAT]:
+        if self.type in _NUMERIC_TYPES:
             if self.min_value is not None and value < self.min_value:
                 return False, f"Field '{self.name}' must be >= {self.min_value}"
             if self.max_value is not None and value > self.max_value:
@@ -83,14 +126,16 @@ class ConfigSchema:
     
     def __init__(self):
         self.fields = self._define_schema()
+        # Nested defaults built once; get_default_config hands out copies
+        self._default_config = self._build_default_config()
+        self.type_only_checks = self._build_type_only_checks()
     
     def _define_schema(self) -> Dict[str, ConfigField]:
         """Define the complete configuration schema"""
         
         def validate_model_path(path: str) -> tuple[bool, str]:
             """Validate model path exists or is downloadable"""
-            import os
-            if os.path.exists(path):
+            if _path_is_dir_cached(path) is not None:
                 return True, ""
             # Check if it's a known model name that can be downloaded
             known_models = ["yolov8s.pt", "yolov8m.pt", "yolov8l.pt", "yolov8x.pt"]
@@ -99,13 +144,23 @@ class ConfigSchema:
             return False, "Model path does not exist and is not a known downloadable model"
         
         def validate_directory_path(path: str) -> tuple[bool, str]:
-            """Validate directory path can be created"""
-            import os
-            try:
-                os.makedirs(path, exist_ok=True)
+            """Validate directory path exists or can be created (without creating it)"""
+            target = os.path.abspath(path)
+            is_dir = _path_is_dir_cached(target)
+            if is_dir:
                 return True, ""
-            except Exception as e:
-                return False, f"Cannot create directory: {e}"
+            if is_dir is not None:
+                return False, f"Cannot create directory: '{path}' is a file"
+            
+            # The nearest existing ancestor must be a writable directory
+            ancestor = os.path.dirname(target)
+            is_dir = _path_is_dir_cached(ancestor)
+            while is_dir is None and os.path.dirname(ancestor) != ancestor:
+                ancestor = os.path.dirname(ancestor)
+                is_dir = _path_is_dir_cached(ancestor)
+            if not is_dir or not os.access(ancestor, os.W_OK | os.X_OK):
+                return False, f"Cannot create directory: '{ancestor}' is not a writable directory"
+            return True, ""
         
         return {
             # Detection Configuration
@@ -225,6 +280,20 @@ class ConfigSchema:
                 min_value=0.01,
                 max_value=1.0
             ),
+            "calibration.green_dominance_ratio": ConfigField(
+                name="calibration.green_dominance_ratio",
+                type=ConfigType.FLOAT,
+                default=1.15,
+                description="Minimum green-to-blue/red ratio for a frame to be searched for a table (0 disables)",
+                min_value=0.0,
+                max_value=3.0
+            ),
+            "calibration.pre_blur": ConfigField(
+                name="calibration.pre_blur",
+                type=ConfigType.BOOLEAN,
+                default=False,
+                description="Gaussian-blur frames before edge detection (for noisy sources)"
+            ),
             
             # System Configuration
             "system.debug_mode": ConfigField(
@@ -333,14 +402,28 @@ class ConfigSchema:
     
     def get_default_config(self) -> Dict[str, Any]:
         """Get default configuration values"""
+        return _clone_config(self._default_config)
+    
+    def _build_default_config(self) -> Dict[str, Any]:
+        """Nest every field default under its dotted name"""
         config = {}
         for field_name, field_def in self.fields.items():
             self._set_nested_value(config, field_name, field_def.default)
         return config
     
+    def _build_type_only_checks(self) -> tuple:
+        """(name, accepted types) for fields whose only rule is the type check"""
+        return tuple(
+            (field_name, _TYPE_CHECKS[field_def.type][0])
+            for field_name, field_def in self.fields.items()
+            if field_def.type in _TYPE_CHECKS
+            and field_def.min_value is None and field_def.max_value is None
+            and not field_def.allowed_values and field_def.validation_func is None
+        )
+    
     def _set_nested_value(self, config: Dict[str, Any], key: str, value: Any) -> None:
         """Set nested dictionary value using dot notation"""
-        keys = key.split('.')
+        keys = _split_key(key)
         current = config
         
         for k in keys[:-1]:
@@ -5,7 +5,7 @@ Configuration validation utilities
 
 import logging
 from typing import Dict, Any, List, Tuple, Optional
-from .config_schema import ConfigSchema, ConfigField
+from .config_schema import ConfigSchema, ConfigField, _clone_config, _split_key
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +54,9 @@ class ConfigValidator:
     
     def __init__(self, schema: Optional[ConfigSchema] = None):
         self.schema = schema or ConfigSchema()
+        # Field documentation is static per schema; built on first request
+        self._field_docs: Optional[Dict[str, Dict[str, Any]]] = None
+        self._field_docs_by_section: Optional[Dict[str, List[Tuple[str, Dict[str, Any]]]]] = None
     
     def validate_config(self, config: Dict[str, Any], 
                        auto_fix: bool = True) -> ValidationResult:
@@ -63,8 +66,17 @@ class ConfigValidator:
         # Flatten config for validation
         flat_config = self._flatten_dict(config)
         
-        # Validate each field in schema
-        for field_name, field_def in self.schema.get_all_fields().items():
+        # Type-only fields whose value already has the right type cannot
+        # fail, so settle them in one pass instead of a call per field
+        flat_get = flat_config.get
+        passed = {name for name, types in self.schema.type_only_checks
+                  if isinstance(flat_get(name), types)}
+        
+        # Validate each remaining field in schema
+        all_fields = self.schema.get_all_fields()
+        for field_name, field_def in all_fields.items():
+            if field_name in passed:
+                continue
             value = flat_config.get(field_name)
             
             # Validate field
@@ -81,15 +93,13 @@ class ConfigValidator:
                 result.fixed_values[field_name] = field_result.fixed_values[field_name]
         
         # Check for unknown fields
-        schema_fields = set(self.schema.get_all_fields().keys())
-        config_fields = set(flat_config.keys())
-        unknown_fields = config_fields - schema_fields
+        unknown_fields = flat_config.keys() - all_fields.keys()
         
         for unknown_field in unknown_fields:
             result.add_warning(f"Unknown configuration field: '{unknown_field}'")
         
         # Check for missing required fields
-        for field_name, field_def in self.schema.get_all_fields().items():
+        for field_name, field_def in all_fields.items():
             if field_def.required and field_name not in flat_config:
                 if auto_fix:
                     result.add_fix(field_name, None, field_def.default)
@@ -264,7 +274,22 @@ class ConfigValidator:
     
     def get_all_field_info(self) -> Dict[str, Dict[str, Any]]:
         """Get information for all fields"""
-        return {
-            name: self.get_field_info(name)
-            for name in self.schema.get_all_fields().keys()
-        }
\ No newline at end of file
+        return _clone_config(self._build_field_docs())
+    
+    def get_field_info_by_section(self) -> Dict[str, List[Tuple[str, Dict[str, Any]]]]:
+        """Get (name, info) pairs for all fields grouped by top-level section"""
+        if self._field_docs_by_section is None:
+            sections: Dict[str, List[Tuple[str, Dict[str, Any]]]] = {}
+            for field_name, info in self._build_field_docs().items():
+                sections.setdefault(_split_key(field_name)[0], []).append((field_name, info))
+            self._field_docs_by_section = sections
+        return self._field_docs_by_section
+    
+    def _build_field_docs(self) -> Dict[str, Dict[str, Any]]:
+        """Field info for the whole schema, computed once"""
+        if self._field_docs is None:
+            self._field_docs = {
+                name: self.get_field_info(name)
+                for name in self.schema.fields
+            }
+        return self._field_docs
\ No newline at end of file
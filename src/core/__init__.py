@@ -5,7 +5,7 @@ Core module for snooker ball detection and tracking system
 
 from .data_models import (
     Point, BoundingBox, Detection, TrackedBall, CalibrationData, FrameAnalysis,
-    BallType, DetectionConfig, TrackingConfig, CalibrationConfig, SystemConfig,
+    BallEvent, BallType, DetectionConfig, TrackingConfig, CalibrationConfig, SystemConfig,
     BALL_CLASSES, get_ball_color, get_ball_name
 )
 
@@ -35,7 +35,7 @@ except ImportError:
 __all__ = [
     # Data models
     'Point', 'BoundingBox', 'Detection', 'TrackedBall', 'CalibrationData', 'FrameAnalysis',
-    'BallType', 'DetectionConfig', 'TrackingConfig', 'CalibrationConfig', 'SystemConfig',
+    'BallEvent', 'BallType', 'DetectionConfig', 'TrackingConfig', 'CalibrationConfig', 'SystemConfig',
     'BALL_CLASSES', 'get_ball_color', 'get_ball_name',
     
     # Interfaces
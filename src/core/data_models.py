@@ -33,6 +33,11 @@ class Point:
     def to_tuple(self) -> Tuple[float, float]:
         """Convert to tuple format"""
         return (self.x, self.y)
+    
+    @classmethod
+    def from_array(cls, array: np.ndarray) -> List['Point']:
+        """Build points from an (N, 2) array"""
+        return [cls(x, y) for x, y in np.asarray(array).reshape(-1, 2).tolist()]
 
 @dataclass
 class BoundingBox:
@@ -53,6 +58,11 @@ class BoundingBox:
     def to_xyxy(self) -> Tuple[int, int, int, int]:
         """Convert to (x1, y1, x2, y2) format"""
         return (self.x1, self.y1, self.x2, self.y2)
+    
+    @classmethod
+    def from_array(cls, array: np.ndarray) -> List['BoundingBox']:
+        """Build bounding boxes from an (N, 4) array of x1, y1, x2, y2 rows"""
+        return [cls(x1, y1, x2, y2) for x1, y1, x2, y2 in np.asarray(array).reshape(-1, 4).tolist()]
 
 @dataclass
 class Detection:
@@ -147,6 +157,30 @@ class FrameAnalysis:
         """Get only active tracked balls"""
         return [ball for ball in self.tracked_balls if ball.is_active]
 
+@dataclass
+class BallEvent:
+    """Ball event delivered to detection API event callbacks"""
+    __slots__ = ('type', 'ball_id', 'ball_type', 'frame', 'timestamp')
+    
+    BALL_POTTED = 1
+    TYPE_NAMES = {BALL_POTTED: 'ball_potted'}
+    
+    type: int
+    ball_id: int
+    ball_type: BallType
+    frame: int
+    timestamp: float
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to JSON-friendly dictionary"""
+        return {
+            'type': self.TYPE_NAMES[self.type],
+            'ball_id': self.ball_id,
+            'ball_type': self.ball_type.name,
+            'frame': self.frame,
+            'timestamp': self.timestamp
+        }
+
 # Configuration Classes
 @dataclass
 class DetectionConfig:
@@ -174,6 +208,8 @@ class CalibrationConfig:
     auto_recalibrate: bool = True
     calibration_interval: int = 100  # frames
     corner_detection_threshold: float = 0.1
+    green_dominance_ratio: float = 1.15  # green must exceed blue and red by this factor; 0 disables
+    pre_blur: bool = False  # Gaussian blur before Canny, for noisy sources
     
 @dataclass
 class SystemConfig:
@@ -203,9 +203,11 @@ class DetectionFormatter:
         formatted_detections = []
         
         for detection in detections:
-            ball_type = detection.get_ball_type()
-            ball_name, color = BALL_CLASSES[ball_type.value]
-            centroid = detection.get_centroid()
+            ball_name, color = BALL_CLASSES[detection.class_id]
+            bbox = detection.bbox
+            x1, y1, x2, y2 = bbox.x1, bbox.y1, bbox.x2, bbox.y2
+            width = x2 - x1
+            height = y2 - y1
             
             formatted_detection = {
                 'id': id(detection),  # Temporary ID
@@ -213,17 +215,17 @@ class DetectionFormatter:
                 'ball_class_id': detection.class_id,
                 'confidence': round(detection.confidence, 3),
                 'bounding_box': {
-                    'x1': detection.bbox.x1,
-                    'y1': detection.bbox.y1,
-                    'x2': detection.bbox.x2,
-                    'y2': detection.bbox.y2,
-                    'width': detection.bbox.x2 - detection.bbox.x1,
-                    'height': detection.bbox.y2 - detection.bbox.y1,
-                    'area': detection.bbox.get_area()
+                    'x1': x1,
+                    'y1': y1,
+                    'x2': x2,
+                    'y2': y2,
+                    'width': width,
+                    'height': height,
+                    'area': width * height
                 },
                 'centroid': {
-                    'x': round(centroid.x, 2),
-                    'y': round(centroid.y, 2)
+                    'x': round((x1 + x2) / 2, 2),
+                    'y': round((y1 + y2) / 2, 2)
                 },
                 'color_bgr': color,
                 'timestamp': detection.timestamp
@@ -462,7 +462,7 @@ class FrameProcessor(IFrameProcessor):
         
         # Draw calibration
         if analysis.calibration_data and analysis.calibration_data.is_calibrated():
-            vis_frame = self.calibration_engine.visualize_calibration(vis_frame)
+            vis_frame = self.calibration_engine.visualize_calibration(vis_frame, in_place=True)
         
         # Draw tracking
         if analysis.tracked_balls:
@@ -4,6 +4,7 @@ Debug visualization for snooker detection system
 """
 
 import logging
+import os
 import time
 from typing import List, Optional, Dict, Any, Tuple
 import numpy as np
@@ -16,6 +17,10 @@ from ..core import (
 
 logger = logging.getLogger(__name__)
 
+# Debug frames are for inspection only; 85 roughly halves file size vs the
+# OpenCV default of 95 with no visible difference
+DEBUG_JPEG_QUALITY = 85
+
 class DebugVisualizer:
     """Comprehensive debug visualization for the detection system"""
     
@@ -48,7 +53,6 @@ class DebugVisualizer:
         
         # Create output directory if saving frames
         if self.save_frames:
-            import os
             os.makedirs(self.output_directory, exist_ok=True)
     
     def visualize_frame_analysis(self, frame: np.ndarray, 
@@ -228,7 +232,7 @@ class DebugVisualizer:
         try:
             filename = f"debug_frame_{frame_number:06d}.jpg"
             filepath = f"{self.output_directory}/{filename}"
-            cv2.imwrite(filepath, frame)
+            self.write_image(filepath, frame)
             
             if frame_number % 100 == 0:  # Log every 100th frame
                 logger.debug(f"Saved debug frame: {filepath}")
@@ -236,6 +240,21 @@ class DebugVisualizer:
         except Exception as e:
             logger.error(f"Failed to save debug frame: {e}")
     
+    @staticmethod
+    def write_image(filepath: str, frame: np.ndarray) -> bool:
+        """Encode frame in memory and write it with a single buffered file write"""
+        ext = os.path.splitext(filepath)[1].lower() or '.jpg'
+        params = [cv2.IMWRITE_JPEG_QUALITY, DEBUG_JPEG_QUALITY] if ext in ('.jpg', '.jpeg') else []
+        
+        ok, buffer = cv2.imencode(ext, frame, params)
+        if not ok:
+            logger.error(f"Failed to encode image: {filepath}")
+            return False
+        
+        with open(filepath, 'wb') as f:
+            f.write(buffer.tobytes())
+        return True
+    
     def visualize_error_overlay(self, frame: np.ndarray, 
                               error_events: List[ErrorEvent]) -> np.ndarray:
         """Draw error information overlay"""
@@ -343,7 +362,6 @@ class DebugVisualizer:
             
             # Create output directory if needed
             if self.save_frames:
-                import os
                 os.makedirs(self.output_directory, exist_ok=True)
     
     def get_visualization_stats(self) -> Dict[str, Any]:
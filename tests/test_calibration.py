@@ -11,7 +11,9 @@ import os
 from unittest.mock import Mock, patch, MagicMock
 
 from src.core import CalibrationConfig, CalibrationData, Point, BoundingBox
-from src.calibration import TableCalibrationEngine
+from src.calibration import TableCalibrationEngine, CoordinateTransformer, CalibrationPersistenceManager
+from src.calibration.calibration_persistence import _load_pickle
+from src.calibration.table_calibration_engine import _corners_from_lines
 
 class TestTableCalibrationEngine(unittest.TestCase):
     """Test cases for TableCalibrationEngine"""
@@ -79,6 +81,16 @@ class TestTableCalibrationEngine(unittest.TestCase):
         for corner in corners:
             self.assertIsInstance(corner, Point)
     
+    def test_detect_table_corners_locates_synthetic_table(self):
+        """Test segment-based detection recovers the synthetic table outline"""
+        engine = TableCalibrationEngine(self.config)
+        
+        corners = engine.detect_table_corners(self.table_frame)
+        
+        self.assertEqual(len(corners), 4)
+        for corner, (x, y) in zip(corners, [(100, 80), (540, 80), (540, 400), (100, 400)]):
+            self.assertLess(corner.distance_to(Point(x, y)), 5.0)
+    
     def test_calculate_homography_insufficient_corners(self):
         """Test homography calculation with insufficient corners"""
         engine = TableCalibrationEngine(self.config)
@@ -156,10 +168,21 @@ class TestTableCalibrationEngine(unittest.TestCase):
                 success = engine.calibrate_frame(self.table_frame, frame_number=1, video_source="test.mp4")
                 
                 self.assertTrue(success)
+                self.assertTrue(engine.flush_pending_saves())
                 
                 # Check if calibration was saved
                 cache_files = os.listdir(temp_dir)
                 self.assertGreater(len(cache_files), 0)
+                
+                # The homography lives only in the binary payload, never in JSON
+                persistence = engine.persistence_manager
+                self.assertFalse(persistence.homography_file.exists())
+                with open(persistence.metadata_file) as f:
+                    self.assertNotIn("homography_matrix", f.read())
+                with open(persistence.calibration_file, 'rb') as f:
+                    payload = _load_pickle(f)
+                np.testing.assert_array_equal(payload["homography_matrix"],
+                                              engine.get_calibration_data().homography_matrix)
     
     def test_calibration_recovery(self):
         """Test calibration recovery mechanisms"""
@@ -174,6 +197,7 @@ class TestTableCalibrationEngine(unittest.TestCase):
                 ]
                 
                 engine.calibrate_frame(self.table_frame, frame_number=1, video_source="test.mp4")
+            engine.close()
             
             # Create new engine instance (simulating restart)
             engine2 = TableCalibrationEngine(self.config, cache_directory=temp_dir)
@@ -181,6 +205,44 @@ class TestTableCalibrationEngine(unittest.TestCase):
             # Should load cached calibration
             self.assertTrue(engine2.is_calibrated())
     
+    def test_calibrate_stream_stops_on_success(self):
+        """Test streamed calibration feeds frames in order and stops once calibrated"""
+        engine = TableCalibrationEngine(self.config)
+        capture = Mock()
+        capture.read.side_effect = [(True, self.test_frame)] * 2 + [(True, self.table_frame)] * 10 + [(False, None)]
+        corners = [Point(100, 100), Point(500, 100), Point(500, 300), Point(100, 300)]
+        
+        with patch.object(engine, 'detect_table_corners',
+                          side_effect=lambda frame: corners if frame is self.table_frame else []):
+            self.assertTrue(engine.calibrate_stream(capture, video_source="test.mp4"))
+        
+        self.assertTrue(engine.is_calibrated())
+        self.assertEqual(engine.last_calibration_frame, 2)
+        engine.close()
+        
+        empty_capture = Mock()
+        empty_capture.read.return_value = (False, None)
+        self.assertFalse(TableCalibrationEngine(self.config).calibrate_stream(empty_capture))
+    
+    def test_calibrate_frames_batch_picks_consensus_frame(self):
+        """Test batch calibration skips failed and outlier detections"""
+        engine = TableCalibrationEngine(self.config)
+        frames = [np.full((480, 640, 3), shade, dtype=np.uint8) for shade in range(4)]
+        detections = {
+            0: [],
+            1: [Point(100, 100), Point(500, 100), Point(500, 300), Point(100, 300)],
+            2: [Point(160, 150), Point(560, 150), Point(560, 350), Point(160, 350)],
+            3: [Point(102, 101), Point(501, 99), Point(499, 301), Point(101, 300)]
+        }
+        
+        with patch.object(engine, 'detect_table_corners', side_effect=lambda frame: detections[int(frame[0, 0, 0])]):
+            self.assertTrue(engine.calibrate_frames_batch(frames, [40, 41, 42, 43]))
+        
+        self.assertIn(engine.last_calibration_frame, (41, 43))
+        self.assertEqual(engine.get_calibration_data().table_corners, detections[engine.last_calibration_frame - 40])
+        self.assertFalse(engine.calibrate_frames_batch([]))
+        engine.close()
+    
     def test_camera_angle_change_detection(self):
         """Test camera angle change detection"""
         engine = TableCalibrationEngine(self.config)
@@ -191,6 +253,9 @@ class TestTableCalibrationEngine(unittest.TestCase):
             Point(500, 300), Point(100, 300)
         ]
         engine.previous_corners = initial_corners
+        self.assertEqual(engine._corners_np.dtype, np.float32)
+        self.assertEqual(engine._corners_np.shape, (4, 2))
+        self.assertEqual(engine.previous_corners, initial_corners)
         
         # Test with similar corners (no change)
         similar_frame = self.table_frame.copy()
@@ -213,6 +278,116 @@ class TestTableCalibrationEngine(unittest.TestCase):
             change_detected = engine._detect_camera_angle_change(similar_frame)
             self.assertTrue(change_detected)
     
+    def test_camera_angle_change_skips_unchanged_table_region(self):
+        """Test drift checks skip corner detection while the table region looks unchanged"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            engine = TableCalibrationEngine(self.config, cache_directory=temp_dir)
+            corners = [Point(100, 80), Point(540, 80), Point(540, 400), Point(100, 400)]
+            engine._apply_calibration(corners, np.eye(3), self.table_frame, 1, "test.mp4")
+            
+            with patch.object(engine, 'detect_table_corners', return_value=corners) as detect:
+                self.assertFalse(engine._detect_camera_angle_change(self.table_frame.copy()))
+                detect.assert_not_called()
+                
+                # A region that no longer matches falls through to corner detection
+                shifted = np.roll(self.table_frame, 120, axis=1)
+                engine._detect_camera_angle_change(shifted)
+                detect.assert_called()
+            engine.close()
+    
+    def test_camera_angle_change_uses_mean_displacement(self):
+        """Test the angle-change threshold applies to the mean corner displacement"""
+        engine = TableCalibrationEngine(self.config)
+        engine.previous_corners = [
+            Point(100, 100), Point(500, 100),
+            Point(500, 300), Point(100, 300)
+        ]
+        
+        # Three corners still, one moved 3-4-5 by 200px: mean displacement 50px
+        with patch.object(engine, 'detect_table_corners', return_value=[
+                Point(100, 100), Point(500, 100), Point(620, 460), Point(100, 300)]):
+            self.assertFalse(engine._detect_camera_angle_change(self.table_frame))
+        
+        with patch.object(engine, 'detect_table_corners', return_value=[
+                Point(100, 100), Point(500, 100), Point(620, 461), Point(100, 300)]):
+            self.assertTrue(engine._detect_camera_angle_change(self.table_frame))
+    
+    def test_corner_detection_reuses_cached_frames(self):
+        """Test repeated frames reuse cached corners and the cache stays bounded"""
+        engine = TableCalibrationEngine(self.config)
+        
+        with patch.object(engine, '_detect_corners_in_gray', wraps=engine._detect_corners_in_gray) as detect:
+            first = engine.detect_table_corners(self.table_frame)
+            second = engine.detect_table_corners(self.table_frame.copy())
+            self.assertEqual(first, second)
+            self.assertEqual(detect.call_count, 1)
+            
+            for shade in range(engine.CORNER_CACHE_SIZE + 2):
+                engine.detect_table_corners(np.full((48, 64, 3), shade * 20, dtype=np.uint8))
+            self.assertEqual(len(engine._corner_cache), engine.CORNER_CACHE_SIZE)
+    
+    def test_pre_blur_is_optional(self):
+        """Test edge detection blurs the frame only when pre_blur is enabled"""
+        engine = TableCalibrationEngine(self.config)
+        gray = cv2.cvtColor(self.table_frame, cv2.COLOR_BGR2GRAY)
+        
+        with patch('src.calibration.table_calibration_engine.cv2.GaussianBlur',
+                   wraps=cv2.GaussianBlur) as blur:
+            engine._detect_lines_cpu(gray)
+            blur.assert_not_called()
+            
+            engine.config.pre_blur = True
+            engine._detect_lines_cpu(gray)
+            blur.assert_called_once()
+    
+    def test_corner_detection_skips_frames_without_felt(self):
+        """Test frames without dominant green are rejected before line detection"""
+        engine = TableCalibrationEngine(self.config)
+        crowd_frame = np.full((480, 640, 3), (90, 80, 120), dtype=np.uint8)
+        
+        with patch.object(engine, '_detect_corners_in_gray', return_value=[]) as detect:
+            self.assertEqual(engine.detect_table_corners(crowd_frame), [])
+            detect.assert_not_called()
+            
+            engine.config.green_dominance_ratio = 0.0
+            engine._corner_cache.clear()
+            engine.detect_table_corners(crowd_frame)
+            detect.assert_called_once()
+    
+    def test_corner_detection_downsamples_wide_frames(self):
+        """Test wide frames are detected at reduced size and corners mapped back"""
+        engine = TableCalibrationEngine(self.config)
+        wide_frame = cv2.resize(self.table_frame, (1920, 1440), interpolation=cv2.INTER_NEAREST)
+        
+        with patch.object(engine, '_detect_corners_in_gray',
+                          return_value=[Point(100, 80), Point(540, 80), Point(540, 400), Point(100, 400)]) as detect:
+            corners = engine.detect_table_corners(wide_frame)
+        
+        small, scale = detect.call_args[0]
+        self.assertEqual(small.shape, (720, engine.DETECTION_WIDTH))
+        self.assertEqual(scale, 2.0)
+        self.assertEqual(corners[2], Point(1080, 800))
+    
+    def test_camera_angle_change_uses_table_region(self):
+        """Test angle-change probes only process the last calibrated table region"""
+        engine = TableCalibrationEngine(self.config)
+        engine.previous_corners = [
+            Point(100, 100), Point(500, 100),
+            Point(500, 300), Point(100, 300)
+        ]
+        engine._last_roi = engine._corner_roi(engine.previous_corners, self.table_frame.shape)
+        x1, y1, x2, y2 = engine._last_roi
+        
+        with patch.object(engine, 'detect_table_corners') as mock_detect:
+            # Corners come back relative to the cropped region
+            mock_detect.return_value = [
+                Point(102 - x1, 102 - y1), Point(498 - x1, 98 - y1),
+                Point(502 - x1, 298 - y1), Point(98 - x1, 302 - y1)
+            ]
+            
+            self.assertFalse(engine._detect_camera_angle_change(self.table_frame))
+            self.assertEqual(mock_detect.call_args[0][0].shape[:2], (y2 - y1, x2 - x1))
+    
     def test_reset_calibration(self):
         """Test calibration reset"""
         engine = TableCalibrationEngine(self.config)
@@ -262,6 +437,38 @@ class TestTableCalibrationEngine(unittest.TestCase):
         
         self.assertGreaterEqual(len(horizontal), 1)
         self.assertGreaterEqual(len(vertical), 1)
+        
+        # Diagonal lines are dropped; lines near 180 degrees count as horizontal
+        horizontal, vertical = engine._filter_lines(np.array([
+            [[400, np.pi / 4]], [[500, np.pi - 0.05]], [[600, np.pi / 2 + 0.2]]
+        ]))
+        self.assertEqual(horizontal, [(500, np.pi - 0.05)])
+        self.assertEqual(vertical, [(600, np.pi / 2 + 0.2)])
+    
+    def test_fused_corner_kernel_matches_staged_methods(self):
+        """Test the compiled line-to-corner pass agrees with the step-by-step methods"""
+        engine = TableCalibrationEngine(self.config)
+        lines = np.array([
+            [[100, np.pi / 2]], [[110, np.pi / 2 + 0.01]], [[400, np.pi / 2 - 0.02]],
+            [[80, 0.0]], [[560, 0.03]], [[300, np.pi / 4]]
+        ])
+        
+        horizontal, vertical = engine._filter_lines(lines)
+        expected = engine._order_corners(engine._find_line_intersections(horizontal, vertical))[:4]
+        corners = _corners_from_lines(lines.reshape(-1, 2).astype(np.float64), 30.0)
+        
+        self.assertEqual(corners.shape, (4, 2))
+        np.testing.assert_allclose(corners, [(p.x, p.y) for p in expected])
+        self.assertEqual(_corners_from_lines(lines[:2].reshape(-1, 2).astype(np.float64), 30.0).shape, (0, 2))
+    
+    def test_remove_duplicate_lines(self):
+        """Test near-duplicate lines collapse to the first in |rho| order"""
+        engine = TableCalibrationEngine(self.config)
+        lines = [(-120.0, 0.2), (100.0, 0.1), (310.0, 0.0), (-95.0, 0.3), (300.0, 0.05), (10.0, 0.0)]
+        
+        self.assertEqual(engine._remove_duplicate_lines(lines),
+                         [(10.0, 0.0), (-95.0, 0.3), (100.0, 0.1), (300.0, 0.05)])
+        self.assertEqual(engine._remove_duplicate_lines([]), [])
     
     def test_line_intersection(self):
         """Test line intersection calculation"""
@@ -275,6 +482,18 @@ class TestTableCalibrationEngine(unittest.TestCase):
         
         self.assertIsNotNone(intersection)
         self.assertIsInstance(intersection, Point)
+        
+        # Batched intersections match the pairwise computation, skipping parallel pairs
+        horizontal = [(100, 0.0), (-250, 0.1), (300, np.pi / 2)]
+        vertical = [(200, np.pi / 2), (50, 1.4), (80, 0.0)]
+        expected = [engine._line_intersection(h_rho, h_theta, v_rho, v_theta)
+                    for h_rho, h_theta in horizontal for v_rho, v_theta in vertical]
+        expected = [p for p in expected if p is not None]
+        batched = engine._find_line_intersections(horizontal, vertical)
+        self.assertEqual(len(batched), len(expected))
+        for actual, wanted in zip(batched, expected):
+            self.assertAlmostEqual(actual.x, wanted.x, places=6)
+            self.assertAlmostEqual(actual.y, wanted.y, places=6)
     
     def test_corner_ordering(self):
         """Test corner point ordering"""
@@ -293,6 +512,8 @@ class TestTableCalibrationEngine(unittest.TestCase):
         self.assertEqual(len(ordered_corners), 4)
         # Check that corners are properly ordered (clockwise from top-left)
         self.assertIsInstance(ordered_corners[0], Point)
+        self.assertEqual(ordered_corners, [Point(100, 100), Point(500, 100),
+                                           Point(500, 300), Point(100, 300)])
 
 class TestCalibrationPersistence(unittest.TestCase):
     """Test calibration persistence functionality"""
@@ -301,12 +522,24 @@ class TestCalibrationPersistence(unittest.TestCase):
         """Set up persistence test fixtures"""
         self.config = CalibrationConfig()
         self.temp_dir = tempfile.mkdtemp()
+        self.persistence = CalibrationPersistenceManager(self.temp_dir)
     
     def tearDown(self):
         """Clean up temporary files"""
         import shutil
+        self.persistence.close()
         shutil.rmtree(self.temp_dir, ignore_errors=True)
     
+    def _save_unit_calibration(self, homography=None):
+        """Save a valid calibration over the unit square and return it"""
+        calibration = CalibrationData(
+            homography_matrix=np.eye(3, dtype=np.float32) if homography is None else homography,
+            table_corners=[Point(0, 0), Point(1, 0), Point(1, 1), Point(0, 1)],
+            is_valid=True
+        )
+        self.assertTrue(self.persistence.save_calibration_data(calibration))
+        return calibration
+    
     def test_calibration_save_and_load(self):
         """Test saving and loading calibration data"""
         engine = TableCalibrationEngine(self.config, cache_directory=self.temp_dir)
@@ -336,6 +569,149 @@ class TestCalibrationPersistence(unittest.TestCase):
         self.assertTrue(loaded_calibration.is_calibrated())
         self.assertEqual(len(loaded_calibration.table_corners), 4)
     
+    def test_calibration_homography_round_trip(self):
+        """Test homography round-trips through the out-of-band payload and older layouts still load"""
+        import pickle
+        persistence = self.persistence
+        
+        homography = np.array([[2.0, 0.1, -100.0], [0.0, 2.0, -50.0], [0.0, 0.001, 1.0]], dtype=np.float32)
+        test_calibration = self._save_unit_calibration(homography)
+        
+        loaded = persistence.load_calibration_data()
+        np.testing.assert_array_equal(loaded.homography_matrix, homography)
+        self.assertEqual(loaded.homography_matrix.dtype, np.float32)
+        self.assertFalse(persistence.homography_file.exists())
+        # Loaded into writable memory, not a read-only view holding the file open
+        self.assertTrue(loaded.homography_matrix.flags.writeable)
+        
+        # Older versions wrote plain pickles, optionally with the homography in a separate .npy
+        legacy_data = persistence._prepare_for_serialization(test_calibration)
+        with open(persistence.calibration_file, 'wb') as f:
+            pickle.dump(legacy_data, f)
+        legacy = persistence.load_calibration_data()
+        np.testing.assert_array_equal(legacy.homography_matrix, homography)
+        
+        legacy_data["homography_matrix"] = None
+        with open(persistence.calibration_file, 'wb') as f:
+            pickle.dump(legacy_data, f)
+        np.save(persistence.homography_file, homography)
+        legacy = persistence.load_calibration_data()
+        np.testing.assert_array_equal(legacy.homography_matrix, homography)
+    
+    def test_calibration_lazy_load(self):
+        """Test cached calibration payload is only read when a field is accessed"""
+        persistence = self.persistence
+        self._save_unit_calibration()
+        
+        with patch.object(persistence, '_load_payload', wraps=persistence._load_payload) as load_payload:
+            loaded = persistence.load_calibration_data()
+            self.assertTrue(loaded.is_calibrated())
+            load_payload.assert_not_called()
+            
+            self.assertEqual(len(loaded.table_corners), 4)
+            np.testing.assert_array_equal(loaded.homography_matrix, np.eye(3))
+            load_payload.assert_called_once()
+    
+    def test_calibration_lazy_load_detects_replaced_payload(self):
+        """Test a lazy load never pairs its metadata with a payload saved later"""
+        persistence = self.persistence
+        self._save_unit_calibration()
+        
+        loaded = persistence.load_calibration_data()
+        self.assertTrue(loaded.is_calibrated())
+        self._save_unit_calibration(2 * np.eye(3, dtype=np.float32))
+        
+        self.assertIsNone(loaded.homography_matrix)
+        self.assertFalse(loaded.is_calibrated())
+        
+        loaded = persistence.load_calibration_data()
+        persistence.clear_cache()
+        self.assertIsNone(loaded.homography_matrix)
+        self.assertFalse(loaded.is_calibrated())
+    
+    def test_calibration_backup_preserves_previous_save(self):
+        """Test saves rename into place so backups keep the previous contents"""
+        persistence = self.persistence
+        self._save_unit_calibration()
+        self._save_unit_calibration(2 * np.eye(3, dtype=np.float32))
+        
+        self.assertEqual(list(persistence.cache_directory.glob("*.tmp")), [])
+        backups = list(persistence.backup_directory.glob("calibration_data_*.pkl"))
+        self.assertEqual(len(backups), 1)
+        with open(backups[0], 'rb') as f:
+            backup = persistence._reconstruct_from_serialization(_load_pickle(f))
+        np.testing.assert_array_equal(backup.homography_matrix, np.eye(3))
+        
+        loaded = persistence.load_calibration_data(lazy=False)
+        np.testing.assert_array_equal(loaded.homography_matrix, 2 * np.eye(3))
+    
+    def test_calibration_metadata_parsed_once(self):
+        """Test metadata is parsed once until the file is rewritten"""
+        from src.calibration import calibration_persistence
+        persistence = self.persistence
+        test_calibration = self._save_unit_calibration()
+        
+        with patch.object(calibration_persistence, '_json_loads',
+                          wraps=calibration_persistence._json_loads) as json_loads:
+            self.assertTrue(persistence.is_cache_valid())
+            self.assertEqual(json_loads.call_count, 0)
+            self.assertIn("cache_age_hours", persistence.get_cache_metadata())
+            self.assertNotIn("cache_age_hours", persistence._read_metadata())
+            self.assertEqual(json_loads.call_count, 1)
+            
+            # An invalid calibration clears the validity sentinel, so the check parses again
+            test_calibration.is_valid = False
+            self.assertTrue(persistence.save_calibration_data(test_calibration))
+            self.assertFalse(persistence.valid_sentinel_file.exists())
+            self.assertFalse(persistence.is_cache_valid())
+            self.assertEqual(json_loads.call_count, 2)
+    
+    def test_persistence_manager_pickles(self):
+        """Test the persistence manager survives a pickle round trip"""
+        import pickle
+        persistence = self.persistence
+        persistence.max_backups = 2
+        self._save_unit_calibration()
+        
+        restored = pickle.loads(pickle.dumps(persistence))
+        self.assertEqual(restored.cache_directory, persistence.cache_directory)
+        self.assertEqual(restored.max_backups, 2)
+        np.testing.assert_array_equal(restored.load_calibration_data().homography_matrix, np.eye(3))
+        restored.close()
+    
+    def test_default_recovery_returns_independent_calibrations(self):
+        """Test fallback calibrations do not share corner or pocket objects"""
+        from src.calibration import CalibrationRecoveryManager
+        recovery = CalibrationRecoveryManager(self.persistence)
+        
+        first = recovery._recover_with_default_parameters("", 24)
+        first.table_corners[0].x = -1
+        first.pocket_regions[0].x1 = -1
+        
+        second = recovery._recover_with_default_parameters("", 24)
+        self.assertEqual(second.table_corners[0], Point(100, 100))
+        self.assertEqual(second.pocket_regions[0], BoundingBox(90, 90, 110, 110))
+    
+    def test_clear_cache_only_removes_owned_files(self):
+        """Test clearing the cache leaves unrelated files in a shared directory"""
+        persistence = self.persistence
+        self._save_unit_calibration()
+        self._save_unit_calibration()
+        unrelated = os.path.join(self.temp_dir, "notes.txt")
+        with open(unrelated, 'w') as f:
+            f.write("keep")
+        
+        self.assertTrue(persistence.clear_cache())
+        self.assertTrue(os.path.exists(unrelated))
+        self.assertFalse(persistence.calibration_file.exists())
+        self.assertFalse(persistence.metadata_file.exists())
+        self.assertFalse(persistence.valid_sentinel_file.exists())
+        self.assertEqual(list(persistence.backup_directory.iterdir()), [])
+        
+        # Failures surface instead of being reported as success
+        with patch.object(persistence, '_remove_file', side_effect=PermissionError("denied")):
+            self.assertFalse(persistence.clear_cache())
+    
     def test_calibration_cache_validity(self):
         """Test calibration cache validity checking"""
         engine = TableCalibrationEngine(self.config, cache_directory=self.temp_dir)
@@ -380,6 +756,15 @@ class TestCoordinateTransformation(unittest.TestCase):
         
         self.engine.calibration_data = self.calibration_data
     
+    def test_table_dimensions_follow_corner_changes(self):
+        """Test pixel table dimensions track corners changed in place"""
+        transformer = CoordinateTransformer(self.calibration_data)
+        self.assertEqual(transformer.get_table_dimensions_in_pixels(), (200, 100))
+        
+        self.calibration_data.table_corners[1].x = 400
+        self.calibration_data.table_corners[2].x = 400
+        self.assertEqual(transformer.get_table_dimensions_in_pixels(), (300, 100))
+    
     def test_homography_validation(self):
         """Test homography matrix validation"""
         # Valid homography
@@ -390,6 +775,135 @@ class TestCoordinateTransformation(unittest.TestCase):
         
         # Should be valid (or at least not crash)
         self.assertIsInstance(is_valid, bool)
+        
+        # A collapsed mapping is rejected even before reprojection is checked
+        degenerate = np.diag([1e-4, 1e-4, 1.0]).astype(np.float32)
+        self.assertFalse(self.engine._validate_homography(degenerate, valid_src, valid_src * 1e-4))
+    
+    def test_closed_form_inverse_matches_linalg(self):
+        """Test the adjugate 3x3 inverse agrees with np.linalg.inv"""
+        from src.calibration.coordinate_transformer import _inv3x3
+        rng = np.random.default_rng(2)
+        for matrix in [self.homography, rng.normal(size=(3, 3)), rng.normal(size=(3, 3)) * 1e3]:
+            np.testing.assert_allclose(_inv3x3(matrix), np.linalg.inv(matrix.astype(np.float64)),
+                                       rtol=1e-9, atol=1e-12)
+        with self.assertRaises(np.linalg.LinAlgError):
+            _inv3x3(np.zeros((3, 3)))
+    
+    def test_batch_transforms_match_single_points(self):
+        """Test trajectory and bounding box transforms agree with per-point transforms"""
+        transformer = CoordinateTransformer(self.calibration_data)
+        trajectory = [Point(100, 50), Point(180, 90), Point(300, 150)]
+        
+        table_trajectory = transformer.transform_trajectory(trajectory)
+        self.assertEqual(len(table_trajectory), len(trajectory))
+        for pixel_point, table_point in zip(trajectory, table_trajectory):
+            expected = transformer.pixel_to_table(pixel_point)
+            self.assertAlmostEqual(table_point.x, expected.x, places=5)
+            self.assertAlmostEqual(table_point.y, expected.y, places=5)
+        
+        table_bbox = transformer.transform_bounding_box_to_table((100, 50, 300, 150))
+        np.testing.assert_allclose(table_bbox, [table_trajectory[0].x, table_trajectory[0].y,
+                                                table_trajectory[2].x, table_trajectory[2].y], rtol=1e-6)
+        
+        self.assertEqual(CoordinateTransformer().transform_trajectory(trajectory), [])
+        
+        pixel_coords = np.array([[p.x, p.y] for p in trajectory], dtype=np.float32)
+        table_coords = transformer.transform_trajectory_array(pixel_coords)
+        np.testing.assert_allclose(table_coords, [[p.x, p.y] for p in table_trajectory])
+        np.testing.assert_allclose(transformer.table_to_pixel_array(table_coords), pixel_coords, atol=1e-3)
+        self.assertEqual(CoordinateTransformer().transform_trajectory_array(pixel_coords).shape, (0, 2))
+        
+        # Returned arrays never alias the scratch buffers; out= is written in place
+        first = transformer.pixel_to_table_array(pixel_coords)
+        transformer.pixel_to_table_array(pixel_coords[::-1].copy())
+        np.testing.assert_allclose(first, table_coords)
+        out = np.empty((3, 2), dtype=np.float32)
+        result = transformer.pixel_to_table_array(pixel_coords.astype(np.int32), out=out)
+        self.assertTrue(np.shares_memory(result, out))
+        np.testing.assert_allclose(out, table_coords)
+        
+        # out arrays OpenCV cannot write into are rejected rather than left untouched
+        for bad_out in (np.zeros((3, 2)), np.zeros((3, 4), dtype=np.float32)[:, ::2],
+                        np.zeros((2, 2), dtype=np.float32)):
+            with self.assertRaises(ValueError):
+                transformer.pixel_to_table_array(pixel_coords, out=bad_out)
+            with self.assertRaises(ValueError):
+                transformer.table_to_pixel_array(table_coords, out=bad_out)
+    
+    def test_warp_image_matches_warp_perspective(self):
+        """Test cached remap tables reproduce cv2.warpPerspective"""
+        transformer = CoordinateTransformer(self.calibration_data)
+        image = (np.random.default_rng(0).random((200, 400, 3)) * 255).astype(np.uint8)
+        
+        warped = transformer.warp_image_to_table(image)
+        expected = cv2.warpPerspective(image, self.homography, (800, 400))
+        self.assertEqual(warped.shape, expected.shape)
+        self.assertLessEqual(np.abs(warped.astype(int) - expected).max(), 1)
+        
+        self.assertIsNone(CoordinateTransformer().warp_image_to_table(image))
+    
+    def test_points_on_table_match_polygon_test(self):
+        """Test edge-based membership and distances agree with OpenCV for convex and concave outlines"""
+        rng = np.random.default_rng(0)
+        points = rng.uniform(0, 400, (500, 2)).round()
+        
+        for corners in ([Point(100, 50), Point(300, 60), Point(310, 150), Point(90, 140)],
+                        [Point(90, 140), Point(310, 150), Point(300, 60), Point(100, 50)],
+                        [Point(0, 0), Point(100, 0), Point(20, 20), Point(0, 100)]):
+            transformer = CoordinateTransformer(
+                CalibrationData(homography_matrix=self.homography, table_corners=corners)
+            )
+            polygon = np.array([[c.x, c.y] for c in corners], dtype=np.float32)
+            expected = [cv2.pointPolygonTest(polygon, (float(x), float(y)), False) >= 0 for x, y in points]
+            
+            np.testing.assert_array_equal(transformer.are_points_on_table(points), expected)
+            for (x, y), inside in list(zip(points, expected))[:50]:
+                self.assertEqual(transformer.is_point_on_table(Point(x, y)), inside)
+            
+            expected_distances = [abs(cv2.pointPolygonTest(polygon, (float(x), float(y)), True))
+                                  for x, y in points]
+            np.testing.assert_allclose(transformer.get_distances_to_table_edge(points),
+                                       expected_distances, atol=1e-6)
+            for (x, y), expected_distance in list(zip(points, expected_distances))[:20]:
+                self.assertAlmostEqual(transformer.get_distance_to_table_edge(Point(x, y)),
+                                       expected_distance, places=6)
+    
+    def test_polygon_kernels_match_numpy_fallback(self):
+        """Test the polygon kernels agree with their NumPy fallbacks"""
+        from src.calibration import coordinate_transformer
+        rng = np.random.default_rng(1)
+        polygon = np.array([[0, 0], [100, 0], [20, 20], [0, 100]], dtype=np.float64)
+        points = rng.uniform(-50, 150, (300, 2))
+        
+        np.testing.assert_array_equal(coordinate_transformer._points_in_polygon_batch(points, polygon),
+                                      coordinate_transformer._points_in_polygon_numpy(points, polygon))
+        np.testing.assert_allclose(coordinate_transformer._distances_to_polygon_batch(points, polygon),
+                                   coordinate_transformer._distances_to_polygon_numpy(points, polygon))
+        
+        transformer = CoordinateTransformer(self.calibration_data)
+        matrix = transformer.pixel_to_table_matrix
+        np.testing.assert_allclose(coordinate_transformer.perspective_transform_points(points, matrix),
+                                   coordinate_transformer._perspective_transform_numpy(points, matrix))
+        np.testing.assert_allclose(transformer.pixel_to_table_njit(points),
+                                   transformer.pixel_to_table_array(points), rtol=1e-5, atol=1e-6)
+    
+    def test_pocket_proximity_batch_matches_single_points(self):
+        """Test batch pocket checks agree with per-point checks"""
+        from src.calibration.coordinate_transformer import TableGeometry
+        self.calibration_data.pocket_regions = [
+            BoundingBox(90, 40, 110, 60), BoundingBox(290, 40, 310, 60),
+            BoundingBox(290, 140, 310, 160), BoundingBox(90, 140, 110, 160)
+        ]
+        geometry = TableGeometry(self.calibration_data)
+        points = [(100, 50), (130, 80), (305, 155), (200, 100)]
+        
+        nearest = geometry.are_points_near_pocket(points, threshold=45.0)
+        for (x, y), index in zip(points, nearest):
+            near, pocket_id = geometry.is_point_near_pocket(Point(x, y), threshold=45.0)
+            self.assertEqual(pocket_id, index)
+            self.assertEqual(near, index >= 0)
+        self.assertEqual(list(nearest), [0, 0, 2, -1])
 
 if __name__ == '__main__':
     # Create test suite
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+Unit tests for configuration loading and management
+"""
+
+import unittest
+import tempfile
+import shutil
+import os
+import time
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from src.config.config_loader import ConfigLoader, HAS_YAML
+from src.config.config_schema import ConfigSchema
+from src.config import config_manager as config_manager_module
+from src.config.config_manager import ConfigManager
+
+class TestConfigLoader(unittest.TestCase):
+    """Test cases for ConfigLoader"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.loader = ConfigLoader()
+    
+    def tearDown(self):
+        """Clean up temporary files"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def _write(self, name, text):
+        """Write text to a file in the temp directory and return its path"""
+        path = self.temp_dir / name
+        path.write_text(text, encoding='utf-8')
+        return path
+    
+    def test_json_round_trip(self):
+        """Test JSON configs survive a save and load"""
+        path = self.temp_dir / "config.json"
+        config = {"detection": {"confidence_threshold": 0.5, "classes": ["red", "white"]}, "flag": True}
+        
+        self.loader.save_config(config, path)
+        self.assertEqual(self.loader.load_config(path), config)
+    
+    def test_invalid_json_raises_value_error(self):
+        """Test malformed JSON is reported as invalid rather than a generic failure"""
+        path = self._write("broken.json", "{not json")
+        
+        with self.assertRaises(ValueError):
+            self.loader.load_config(path)
+        self.assertFalse(self.loader.validate_file_format(path))
+    
+    @unittest.skipUnless(HAS_YAML, "PyYAML not installed")
+    def test_yaml_load(self):
+        """Test YAML configs load through the safe loader"""
+        path = self._write("config.yaml", "detection:\n  confidence_threshold: 0.5\n")
+        
+        self.assertEqual(self.loader.load_config(path), {"detection": {"confidence_threshold": 0.5}})
+    
+    def test_cached_load_returns_independent_copies(self):
+        """Test cache hits hand out copies and a rewritten file is parsed again"""
+        path = self._write("config.json", '{"section": {"value": 1}}')
+        
+        first = self.loader.load_config(path)
+        first["section"]["value"] = 99
+        self.assertEqual(self.loader.load_config(path), {"section": {"value": 1}})
+        
+        path.write_text('{"section": {"value": 2, "extra": true}}', encoding='utf-8')
+        self.assertEqual(self.loader.load_config(path), {"section": {"value": 2, "extra": True}})
+    
+    def test_validate_file_format_after_cached_load(self):
+        """Test a file already in the parse cache still validates as a bool"""
+        path = self._write("empty.json", "{}")
+        
+        self.assertEqual(self.loader.load_config(path), {})
+        self.assertIs(self.loader.validate_file_format(path), True)
+        
+        path = self._write("section.json", '{"a": 1}')
+        self.loader.load_config(path)
+        self.assertIs(self.loader.validate_file_format(path), True)
+        
+        self.assertFalse(self.loader.validate_file_format(self.temp_dir / "missing.json"))
+
+
+class TestConfigSchema(unittest.TestCase):
+    """Test cases for ConfigSchema field validation"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.schema = ConfigSchema()
+    
+    def tearDown(self):
+        """Clean up temporary files"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def test_output_directory_validation_has_no_side_effects(self):
+        """Test output directories are checked for creatability without being created"""
+        field_def = self.schema.get_field("system.output_directory")
+        target = os.path.join(self.temp_dir, "nested", "output")
+        
+        self.assertTrue(field_def.validate(target)[0])
+        self.assertFalse(os.path.exists(target))
+        self.assertTrue(field_def.validate(self.temp_dir)[0])
+        
+        file_path = os.path.join(self.temp_dir, "file.txt")
+        open(file_path, 'w').close()
+        is_valid, message = field_def.validate(file_path)
+        self.assertFalse(is_valid)
+        self.assertIn("is a file", message)
+    
+    def test_default_manager_creates_no_directories(self):
+        """Test constructing a manager with defaults leaves the working directory untouched"""
+        cwd = os.getcwd()
+        os.chdir(self.temp_dir)
+        try:
+            ConfigManager()
+            self.assertEqual(os.listdir(self.temp_dir), [])
+        finally:
+            os.chdir(cwd)
+
+
+class TestConfigManager(unittest.TestCase):
+    """Test cases for ConfigManager snapshots, notifications and file handling"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.manager = ConfigManager()
+    
+    def tearDown(self):
+        """Clean up temporary files"""
+        self.manager.disable_auto_reload()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def _wait_for(self, predicate, timeout=3.0):
+        """Poll predicate until it holds or the timeout passes"""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if predicate():
+                return True
+            time.sleep(0.02)
+        return predicate()
+    
+    def test_config_views_are_isolated_from_later_writes(self):
+        """Test a view from get_config keeps its values after set_value publishes a new snapshot"""
+        view = self.manager.get_config()
+        old_threshold = view["detection"]["confidence_threshold"]
+        
+        self.assertTrue(self.manager.set_value("detection.confidence_threshold", 0.75))
+        
+        self.assertEqual(view["detection"]["confidence_threshold"], old_threshold)
+        self.assertEqual(self.manager.get_config()["detection"]["confidence_threshold"], 0.75)
+        with self.assertRaises(TypeError):
+            view["detection"]["confidence_threshold"] = 0.1
+        
+        mutable = self.manager.get_config(mutable=True)
+        mutable["detection"]["confidence_threshold"] = 0.1
+        self.assertEqual(self.manager.get_value("detection.confidence_threshold"), 0.75)
+    
+    def test_read_only_view_holds_lists_as_tuples(self):
+        """Test list settings come back as tuples in the view and as lists when mutable"""
+        self.manager.set_value("detection.input_size", [1280, 720])
+        
+        self.assertEqual(self.manager.get_config()["detection"]["input_size"], (1280, 720))
+        mutable_size = self.manager.get_config(mutable=True)["detection"]["input_size"]
+        self.assertEqual(mutable_size, [1280, 720])
+        mutable_size.append(3)
+        self.assertEqual(self.manager.get_config()["detection"]["input_size"], (1280, 720))
+    
+    def test_system_config_copies_are_independent(self):
+        """Test each get_system_config caller gets its own instance"""
+        self.manager.set_value("detection.confidence_threshold", 0.3)
+        first = self.manager.get_system_config()
+        first.detection.confidence_threshold = 0.9
+        
+        self.assertIsNot(first, self.manager.get_system_config())
+        self.assertEqual(self.manager.get_system_config().detection.confidence_threshold, 0.3)
+        self.assertEqual(self.manager.get_value("detection.confidence_threshold"), 0.3)
+    
+    def test_batch_updates_notify_once(self):
+        """Test changes inside batch_updates fire the change callbacks exactly once"""
+        callback = Mock()
+        self.manager.add_change_callback(callback)
+        
+        with self.manager.batch_updates():
+            self.manager.set_value("detection.confidence_threshold", 0.8)
+            self.manager.set_value("tracking.max_disappeared_frames", 20)
+            self.manager.update_config({"system.debug_mode": True}, validate=False)
+            callback.assert_not_called()
+        
+        callback.assert_called_once()
+        config = callback.call_args[0][0]
+        self.assertEqual(config["detection"]["confidence_threshold"], 0.8)
+        self.assertEqual(config["tracking"]["max_disappeared_frames"], 20)
+        self.assertTrue(config["system"]["debug_mode"])
+        
+        # Setting a value to what it already is notifies nobody
+        self.manager.set_value("detection.confidence_threshold", 0.8)
+        callback.assert_called_once()
+    
+    def test_unvalidated_update_returns_own_result(self):
+        """Test update_config without validation returns a fresh, usable result each time"""
+        first = self.manager.update_config({"system.debug_mode": True}, validate=False)
+        self.assertTrue(first.is_valid)
+        first.add_warning("x")
+        
+        second = self.manager.update_config({"system.debug_mode": False}, validate=False)
+        self.assertIsNot(first, second)
+        self.assertEqual(second.warnings, [])
+    
+    def test_get_value_leaf_section_and_missing_keys(self):
+        """Test get_value for leaf keys, whole sections and keys that do not exist"""
+        self.manager.set_value("detection.confidence_threshold", 0.65)
+        
+        self.assertEqual(self.manager.get_value("detection.confidence_threshold"), 0.65)
+        section = self.manager.get_value("detection")
+        self.assertEqual(section["confidence_threshold"], 0.65)
+        self.assertIn("nms_threshold", section)
+        self.assertEqual(self.manager.get_value("detection.missing", "fallback"), "fallback")
+        self.assertIsNone(self.manager.get_value("missing.section.key"))
+        self.assertEqual(self.manager.get_value("detection.confidence_threshold.deeper", 1), 1)
+        
+        # Neither sections nor list leaves can be used to edit the published config
+        with self.assertRaises(TypeError):
+            section["confidence_threshold"] = 0.99
+        self.manager.get_value("detection.input_size").append(3)
+        self.assertEqual(self.manager.get_value("detection.input_size"), [640, 640])
+        self.assertEqual(self.manager.get_system_config().detection.confidence_threshold, 0.65)
+    
+    def test_save_skips_unchanged_config_until_file_is_edited(self):
+        """Test saving an unchanged config is a no-op until the file changes on disk"""
+        path = self.temp_dir / "config.json"
+        
+        with patch.object(self.manager.loader, 'save_config',
+                          wraps=self.manager.loader.save_config) as save_config:
+            self.assertTrue(self.manager.save_to_file(path, create_backup=False))
+            self.assertTrue(self.manager.save_to_file(path, create_backup=False))
+            self.assertEqual(save_config.call_count, 1)
+            
+            path.write_text("{}", encoding='utf-8')
+            self.assertTrue(self.manager.save_to_file(path, create_backup=False))
+            self.assertEqual(save_config.call_count, 2)
+            
+            self.manager.set_value("detection.confidence_threshold", 0.55)
+            self.assertTrue(self.manager.save_to_file(path, create_backup=False))
+            self.assertEqual(save_config.call_count, 3)
+        
+        self.assertEqual(ConfigLoader().load_config(path)["detection"]["confidence_threshold"], 0.55)
+    
+    def test_polling_reload_ignores_touch_and_picks_up_edits(self):
+        """Test the debounced polling reload skips identical rewrites and reloads real changes"""
+        path = self.temp_dir / "config.json"
+        self.assertTrue(self.manager.save_to_file(path, create_backup=False))
+        original = path.read_bytes()
+        
+        with patch.object(config_manager_module, 'HAS_WATCHDOG', False), \
+                patch.object(self.manager, 'load_from_file',
+                             wraps=self.manager.load_from_file) as load_from_file:
+            self.manager.enable_auto_reload(check_interval=0.02, debounce=0.05)
+            
+            # Identical contents with a newer mtime are hashed and left alone
+            stat_result = path.stat()
+            os.utime(path, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 10**9))
+            self.assertTrue(self._wait_for(
+                lambda: self.manager._file_signature == self.manager._stat_signature(path)))
+            load_from_file.assert_not_called()
+            
+            config = ConfigLoader().load_config(path)
+            config["detection"]["confidence_threshold"] = 0.42
+            ConfigLoader().save_config(config, path)
+            self.assertNotEqual(path.read_bytes(), original)
+            self.assertTrue(self._wait_for(
+                lambda: self.manager.get_value("detection.confidence_threshold") == 0.42))
+            load_from_file.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -11,7 +11,10 @@ import os
 import time
 from unittest.mock import Mock, patch
 
-from src.core import SystemConfig, DetectionConfig, TrackingConfig, CalibrationConfig
+from src.core import (
+    SystemConfig, DetectionConfig, TrackingConfig, CalibrationConfig, FrameAnalysis,
+    TrackedBall, BallEvent, BallType, Point
+)
 from src.api import DetectionAPI
 
 class TestEndToEndIntegration(unittest.TestCase):
@@ -183,6 +186,141 @@ class TestEndToEndIntegration(unittest.TestCase):
             vis_stats = api.get_visualization_stats()
             self.assertIn('debug_visualizer', vis_stats)
     
+    def test_debug_visualization_reuses_placeholder(self):
+        """Test debug visualization never mutates or leaks the shared placeholder frame"""
+        api = DetectionAPI(self.config)
+        api.latest_result = FrameAnalysis(frame_number=0, timestamp=time.time())
+        
+        first = api.create_debug_visualization()
+        second = api.create_debug_visualization()
+        
+        self.assertIsNotNone(first)
+        self.assertIsNot(first, second)
+        self.assertTrue(first.flags.writeable)
+        self.assertFalse(api._placeholder_frame.any())
+        
+        # Overlay disabled returns the input frame; the API must still hand out a copy
+        api.debug_visualizer.set_visualization_options(enable_overlay=False)
+        plain = api.create_debug_visualization()
+        self.assertIsNot(plain, api._placeholder_frame)
+        self.assertTrue(plain.flags.writeable)
+    
+    def test_history_index_tracks_eviction(self):
+        """Test the history ring keeps order and the frame-number index stays in sync"""
+        api = DetectionAPI(self.config)
+        maxlen = api.HISTORY_SIZE
+        
+        for i in range(maxlen + 5):
+            api._append_history(FrameAnalysis(frame_number=i, timestamp=time.time()))
+        
+        history = api.get_analysis_history(0)
+        self.assertEqual([a.frame_number for a in history], list(range(5, maxlen + 5)))
+        self.assertEqual([a.frame_number for a in api.get_analysis_history(3)],
+                         [maxlen + 2, maxlen + 3, maxlen + 4])
+        self.assertEqual(len(api._history_index), maxlen)
+        self.assertNotIn(0, api._history_index)
+        self.assertIs(api._history_index[maxlen + 4], history[-1])
+        self.assertIsNotNone(api.create_debug_visualization(frame_number=maxlen))
+        self.assertIsNone(api.create_debug_visualization(frame_number=0))
+    
+    def test_potted_ball_event_notification(self):
+        """Test the fused dispatcher delivers frames and BallEvent structs for potted balls"""
+        api = DetectionAPI(self.config)
+        received = []
+        frames_seen = []
+        api.add_frame_callback(frames_seen.append)
+        api.add_event_callback(received.append)
+        
+        potted = TrackedBall(track_id=7, ball_type=BallType.PINK, current_position=Point(10, 10))
+        potted.was_potted = True
+        still = TrackedBall(track_id=8, ball_type=BallType.RED, current_position=Point(20, 20))
+        analysis = FrameAnalysis(frame_number=42, timestamp=123.0, tracked_balls=[potted, still])
+        
+        api._dispatch(analysis)
+        
+        self.assertEqual(frames_seen, [analysis])
+        self.assertEqual(len(received), 1)
+        self.assertIsInstance(received[0], BallEvent)
+        self.assertEqual(received[0].to_dict(), {
+            'type': 'ball_potted', 'ball_id': 7, 'ball_type': 'PINK',
+            'frame': 42, 'timestamp': 123.0
+        })
+    
+    def test_visualizer_thread_keeps_latest_frame_only(self):
+        """Test the debug visualizer thread drops stale frames instead of queueing them"""
+        import threading
+        
+        api = DetectionAPI(self.config)
+        rendered = []
+        release = threading.Event()
+        
+        def slow_visualize(frame, analysis):
+            release.wait(timeout=5.0)
+            rendered.append(analysis.frame_number)
+        
+        api.debug_visualizer.visualize_frame_analysis = slow_visualize
+        api._start_visualizer_thread()
+        
+        frame = np.zeros((4, 4, 3), dtype=np.uint8)
+        api._publish_debug_frame(frame, FrameAnalysis(frame_number=0, timestamp=0.0))
+        time.sleep(0.1)  # Let the visualizer pick up frame 0 and block on it
+        for i in range(1, 6):
+            api._publish_debug_frame(frame, FrameAnalysis(frame_number=i, timestamp=0.0))
+        
+        release.set()
+        api._stop_visualizer_thread()
+        
+        self.assertEqual(rendered, [0, 5])
+        self.assertIsNone(api.visualizer_thread)
+    
+    def test_export_reflects_threshold_updates(self):
+        """Test exported metadata follows runtime threshold changes"""
+        import json
+        
+        api = DetectionAPI(self.config)
+        api.update_configuration({'confidence_threshold': 0.45})
+        
+        export_path = os.path.join(self.temp_dir, "export.json")
+        self.assertTrue(api.export_analysis_data(export_path))
+        
+        with open(export_path) as f:
+            metadata = json.load(f)['metadata']
+        self.assertEqual(metadata['system_config']['detection_threshold'], 0.45)
+        self.assertEqual(metadata['system_config']['tracking_config']['max_disappeared'], 5)
+    
+    def test_config_change_burst_applies_once(self):
+        """Test a burst of config change notifications is applied once"""
+        api = DetectionAPI(self.config)
+        if api.config_manager is None:
+            self.skipTest("Configuration management not available")
+        
+        with patch.object(api, '_update_system_config') as update_system_config:
+            for _ in range(3):
+                api._on_config_change({})
+            
+            time.sleep(api.CONFIG_DEBOUNCE_SECONDS * 4)
+            update_system_config.assert_called_once()
+        self.assertIsNone(api._config_timer)
+    
+    def test_api_config_change_applies_once(self):
+        """Test a change made through the API is not applied again by the debounced callback"""
+        api = DetectionAPI(self.config)
+        if api.config_manager is None:
+            self.skipTest("Configuration management not available")
+        
+        with patch.object(api, '_update_system_config',
+                          wraps=api._update_system_config) as update_system_config:
+            self.assertTrue(api.set_config_value('detection.confidence_threshold', 0.6, validate=False))
+            time.sleep(api.CONFIG_DEBOUNCE_SECONDS * 4)
+            update_system_config.assert_called_once()
+            
+            # Changes made on the manager directly still arrive through the callback
+            api.config_manager.set_value('detection.confidence_threshold', 0.7, validate=False)
+            time.sleep(api.CONFIG_DEBOUNCE_SECONDS * 4)
+            self.assertEqual(update_system_config.call_count, 2)
+        self.assertEqual(api._applied_config_version, api.config_manager.version)
+        self.assertEqual(api.config.detection.confidence_threshold, 0.7)
+    
     def test_performance_benchmarks(self):
         """Test system performance benchmarks"""
         api = DetectionAPI(self.config)